@@ -12,14 +12,19 @@ from __future__ import annotations
 
 import argparse
 import ast
+import heapq
 import json
 import os
+import re
+import sys
 from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Pattern, Set, Tuple
 
 try:
     from agents.tools._repo_root import find_project_root
@@ -31,8 +36,27 @@ try:
 except Exception:
     pathspec = None  # type: ignore
 
+try:
+    import rustworkx  # type: ignore
+except Exception:
+    rustworkx = None  # type: ignore
 
-@dataclass
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    from yaml import CSafeDumper, dump as yaml_dump  # type: ignore
+except Exception:
+    CSafeDumper = None  # type: ignore
+    yaml_dump = None  # type: ignore
+
+# slots=True needs Python 3.10+; older interpreters keep regular dataclasses.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Node:
     id: str
     kind: str
@@ -42,8 +66,19 @@ class Node:
     is_package: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "label": self.label,
+            "module": self.module,
+            "file_path": self.file_path,
+            "is_package": self.is_package,
+            "metadata": dict(self.metadata),
+        }
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Edge:
     source: str
     target: str
@@ -53,14 +88,28 @@ class Edge:
     lineno: Optional[int] = None
     col_offset: Optional[int] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "target": self.target,
+            "kind": self.kind,
+            "raw": self.raw,
+            "import_type": self.import_type,
+            "lineno": self.lineno,
+            "col_offset": self.col_offset,
+        }
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Issue:
     type: str
     file: str
     message: str
     lineno: Optional[int] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.type, "file": self.file, "message": self.message, "lineno": self.lineno}
+
 
 @dataclass
 class DependencyGraph:
@@ -69,13 +118,19 @@ class DependencyGraph:
     forward: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
     reverse: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
     issues: List[Issue] = field(default_factory=list)
+    internal_fan_out: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    internal_fan_in: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
     def add_node(self, node: Node) -> None:
         self.nodes[node.id] = node
 
     def add_edge(self, edge: Edge) -> None:
         self.edges.append(edge)
-        self.forward[edge.source].add(edge.target)
+        targets = self.forward[edge.source]
+        if edge.target not in targets and edge.source.startswith("module:") and edge.target.startswith("module:"):
+            self.internal_fan_out[edge.source] += 1
+            self.internal_fan_in[edge.target] += 1
+        targets.add(edge.target)
         self.reverse[edge.target].add(edge.source)
 
     def add_issue(self, issue: Issue) -> None:
@@ -105,30 +160,55 @@ def load_gitignore(project_root: Path) -> Tuple[Optional[Any], List[str]]:
     return None, patterns
 
 
-def is_ignored(rel_path: str, spec: Optional[Any], fallback_patterns: List[str]) -> bool:
+FallbackMatcher = Tuple[Tuple[str, ...], Optional[Pattern[str]]]
+
+
+def compile_fallback_patterns(patterns: List[str]) -> FallbackMatcher:
+    dir_prefixes = tuple(pat.rstrip("/") + "/" for pat in patterns if pat.endswith("/"))
+    if not patterns:
+        return dir_prefixes, None
+    # Mirror fnmatch's os.path.normcase behaviour (case-insensitive on Windows).
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    glob_re = re.compile("|".join(f"(?:{translate(pat)})" for pat in patterns), flags)
+    return dir_prefixes, glob_re
+
+
+def is_ignored(rel_path: str, spec: Optional[Any], fallback: FallbackMatcher) -> bool:
     if spec is not None:
         return bool(spec.match_file(rel_path))
-    for pat in fallback_patterns:
-        clean = pat.rstrip("/")
-        if pat.endswith("/") and rel_path.startswith(clean + "/"):
-            return True
-        if fnmatch(rel_path, pat):
-            return True
-    return False
+    dir_prefixes, glob_re = fallback
+    if dir_prefixes and rel_path.startswith(dir_prefixes):
+        return True
+    return glob_re is not None and glob_re.match(rel_path) is not None
+
 
+SKIP_DIRS = frozenset({".git", "__pycache__", ".pytest_cache"})
 
-def discover_python_files(project_root: Path, spec: Optional[Any], patterns: List[str]) -> List[Path]:
+
+def discover_python_files(project_root: Path, spec: Optional[Any], fallback: FallbackMatcher) -> List[Path]:
     files: List[Path] = []
-    for root, dirs, filenames in os.walk(project_root):
-        dirs[:] = [d for d in dirs if d not in {".git", "__pycache__", ".pytest_cache"}]
-        for filename in filenames:
-            if not filename.endswith(".py"):
-                continue
-            p = Path(root) / filename
-            rel = p.relative_to(project_root).as_posix()
-            if is_ignored(rel, spec, patterns):
-                continue
-            files.append(p)
+    root_len = len(os.path.join(str(project_root), ""))
+    # Explicit stack keeps os.walk's top-down, depth-first order so edge output stays stable.
+    stack: List[str] = [str(project_root)]
+    while stack:
+        current = stack.pop()
+        subdirs: List[str] = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    if not entry.name.endswith(".py"):
+                        continue
+                    rel = entry.path[root_len:].replace(os.sep, "/")
+                    if is_ignored(rel, spec, fallback):
+                        continue
+                    files.append(Path(entry.path))
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
     return files
 
 
@@ -155,25 +235,37 @@ def build_module_index(project_root: Path, files: Iterable[Path]) -> Tuple[Dict[
     return module_to_file, file_to_module, module_is_package
 
 
-def pick_internal_module(candidate: str, module_to_file: Dict[str, str]) -> Optional[str]:
-    if candidate in module_to_file:
-        return candidate
-    parts = candidate.split(".")
-    for i in range(len(parts) - 1, 0, -1):
-        prefix = ".".join(parts[:i])
-        if prefix in module_to_file:
-            return prefix
-    return None
+def build_module_trie(module_to_file: Dict[str, str]) -> Dict[Optional[str], Any]:
+    trie: Dict[Optional[str], Any] = {}
+    for module in module_to_file:
+        node = trie
+        for part in module.split("."):
+            node = node.setdefault(part, {})
+        node[None] = module
+    return trie
+
+
+def pick_internal_module_from_trie(candidate: str, trie: Dict[Optional[str], Any]) -> Optional[str]:
+    match: Optional[str] = None
+    node = trie
+    for part in candidate.split("."):
+        node = node.get(part)
+        if node is None:
+            break
+        match = node.get(None, match)
+    return match
+
+
+def package_parts(current_module: str, is_package: bool) -> List[str]:
+    parts = current_module.split(".")
+    return parts if is_package else parts[:-1]
 
 
-def resolve_relative_base(current_module: str, is_package: bool, level: int) -> Optional[str]:
-    package = current_module if is_package else ".".join(current_module.split(".")[:-1])
-    pkg_parts = package.split(".") if package else []
+def relative_base_from_parts(pkg_parts: List[str], level: int) -> Optional[str]:
     drop = max(level - 1, 0)
     if drop > len(pkg_parts):
         return None
-    kept = pkg_parts[: len(pkg_parts) - drop] if drop > 0 else pkg_parts
-    return ".".join(kept)
+    return ".".join(pkg_parts[: len(pkg_parts) - drop])
 
 
 def normalize_config_path(raw: str) -> str:
@@ -212,10 +304,35 @@ def extract_config_accesses(tree: ast.AST) -> List[Tuple[str, int, int]]:
     return accesses
 
 
-def build_dependency_graph(project_root: Path, files: List[Path]) -> DependencyGraph:
+def read_source(file_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    try:
+        return file_path.read_text(encoding="utf-8"), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def iter_sources(files: List[Path], read_workers: int) -> Iterable[Tuple[Optional[str], Optional[str]]]:
+    if read_workers <= 1:
+        return map(read_source, files)
+    # Reads are I/O bound: prefetch them on worker threads (results stay in file order)
+    # while the caller parses. shutdown(wait=False) lets the queued reads finish on their own.
+    executor = ThreadPoolExecutor(max_workers=read_workers)
+    results = executor.map(read_source, files)
+    executor.shutdown(wait=False)
+    return results
+
+
+def build_dependency_graph(project_root: Path, files: List[Path], read_workers: int = 0) -> DependencyGraph:
     module_to_file, _, module_is_package = build_module_index(project_root, files)
     graph = DependencyGraph()
 
+    module_trie = build_module_trie(module_to_file)
+
+    # module_to_file is fixed for the whole build, so repeated import targets resolve once.
+    @lru_cache(maxsize=None)
+    def resolve_internal(candidate: str) -> Optional[str]:
+        return pick_internal_module_from_trie(candidate, module_trie)
+
     for module, rel_path in module_to_file.items():
         graph.add_node(
             Node(
@@ -228,43 +345,46 @@ def build_dependency_graph(project_root: Path, files: List[Path]) -> DependencyG
             )
         )
 
-    for file_path in files:
+    for file_path, (content, read_error) in zip(files, iter_sources(files, read_workers)):
         rel_file = file_path.relative_to(project_root).as_posix()
         module_name, is_package = module_name_from_path(project_root, file_path)
         source_id = f"module:{module_name}"
+        pkg_parts = package_parts(module_name, is_package)
+        if content is None:
+            graph.add_issue(Issue(type="parse_error", file=rel_file, message=read_error or ""))
+            continue
         try:
-            content = file_path.read_text(encoding="utf-8")
             tree = ast.parse(content, filename=rel_file)
         except Exception as exc:
             graph.add_issue(Issue(type="parse_error", file=rel_file, message=str(exc)))
             continue
 
-        # Config edges (module -> config file)
+        # Config edges (module -> config file); source_id is fixed per file, so dedup on cfg_id
         seen_configs: Set[str] = set()
         for raw_cfg, lineno, col in extract_config_accesses(tree):
             cfg_id = f"file:{raw_cfg}"
             if cfg_id not in graph.nodes:
                 graph.add_node(Node(id=cfg_id, kind="config_file", label=raw_cfg, file_path=raw_cfg))
-            key = f"{source_id}->{cfg_id}"
-            if key not in seen_configs:
-                seen_configs.add(key)
-                graph.add_edge(
-                    Edge(
-                        source=source_id,
-                        target=cfg_id,
-                        kind="config_access",
-                        raw=raw_cfg,
-                        lineno=lineno,
-                        col_offset=col,
-                    )
+            if cfg_id in seen_configs:
+                continue
+            seen_configs.add(cfg_id)
+            graph.add_edge(
+                Edge(
+                    source=source_id,
+                    target=cfg_id,
+                    kind="config_access",
+                    raw=raw_cfg,
+                    lineno=lineno,
+                    col_offset=col,
                 )
+            )
 
         # Import edges
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imported = alias.name
-                    target_module = pick_internal_module(imported, module_to_file)
+                    target_module = resolve_internal(imported)
                     if target_module is not None:
                         target_id = f"module:{target_module}"
                     else:
@@ -288,7 +408,7 @@ def build_dependency_graph(project_root: Path, files: List[Path]) -> DependencyG
                 base_module = node.module or ""
 
                 if level > 0:
-                    resolved_base = resolve_relative_base(module_name, is_package, level)
+                    resolved_base = relative_base_from_parts(pkg_parts, level)
                     if resolved_base is None:
                         graph.add_issue(
                             Issue(
@@ -323,9 +443,9 @@ def build_dependency_graph(project_root: Path, files: List[Path]) -> DependencyG
                     candidate = candidate.strip(".")
                     if not candidate:
                         continue
-                    target_module = pick_internal_module(candidate, module_to_file)
+                    target_module = resolve_internal(candidate)
                     if target_module is None and import_base:
-                        target_module = pick_internal_module(import_base, module_to_file)
+                        target_module = resolve_internal(import_base)
 
                     if target_module is not None:
                         target_id = f"module:{target_module}"
@@ -362,11 +482,20 @@ def internal_module_ids(graph: DependencyGraph) -> List[str]:
     return sorted([nid for nid, n in graph.nodes.items() if n.kind == "python_module"])
 
 
+def compute_scc_rustworkx(adj: Dict[str, List[str]], module_ids: List[str]) -> List[List[str]]:
+    rx_graph = rustworkx.PyDiGraph()
+    node_index = {m: i for m, i in zip(module_ids, rx_graph.add_nodes_from(module_ids))}
+    rx_graph.add_edges_from_no_data([(node_index[s], node_index[t]) for s, targets in adj.items() for t in targets])
+    return [sorted(module_ids[i] for i in comp) for comp in rustworkx.strongly_connected_components(rx_graph)]
+
+
 def compute_scc_tarjan(graph: DependencyGraph, module_ids: List[str]) -> List[List[str]]:
     allowed = set(module_ids)
     adj: Dict[str, List[str]] = {
         m: [t for t in graph.forward.get(m, set()) if t in allowed] for m in module_ids
     }
+    if rustworkx is not None:
+        return compute_scc_rustworkx(adj, module_ids)
 
     index = 0
     stack: List[str] = []
@@ -408,27 +537,24 @@ def compute_scc_tarjan(graph: DependencyGraph, module_ids: List[str]) -> List[Li
 
 def compute_metrics(graph: DependencyGraph) -> Dict[str, Any]:
     modules = internal_module_ids(graph)
-    module_set = set(modules)
 
-    fan_out: Dict[str, int] = {}
-    fan_in: Dict[str, int] = {}
-    for m in modules:
-        fan_out[m] = len([t for t in graph.forward.get(m, set()) if t in module_set])
-        fan_in[m] = len([s for s in graph.reverse.get(m, set()) if s in module_set])
+    fan_out: Dict[str, int] = {m: graph.internal_fan_out.get(m, 0) for m in modules}
+    fan_in: Dict[str, int] = {m: graph.internal_fan_in.get(m, 0) for m in modules}
 
     roots = sorted([m for m in modules if fan_in.get(m, 0) == 0])
     sinks = sorted([m for m in modules if fan_out.get(m, 0) == 0])
     isolated = sorted([m for m in modules if fan_in.get(m, 0) == 0 and fan_out.get(m, 0) == 0])
 
     sccs_all = compute_scc_tarjan(graph, modules)
-    cyclic_sccs = [c for c in sccs_all if len(c) > 1]
+    # Both SCC backends return components in traversal order; sort so the artifact is stable.
+    cyclic_sccs = sorted(c for c in sccs_all if len(c) > 1)
     self_cycles = []
     for m in modules:
         if m in graph.forward.get(m, set()):
             self_cycles.append([m])
 
-    top_fan_out = sorted(fan_out.items(), key=lambda x: (-x[1], x[0]))[:20]
-    top_fan_in = sorted(fan_in.items(), key=lambda x: (-x[1], x[0]))[:20]
+    top_fan_out = heapq.nsmallest(20, fan_out.items(), key=lambda x: (-x[1], x[0]))
+    top_fan_in = heapq.nsmallest(20, fan_in.items(), key=lambda x: (-x[1], x[0]))
 
     external_count = len([n for n in graph.nodes.values() if n.kind == "external_package"])
     config_count = len([n for n in graph.nodes.values() if n.kind == "config_file"])
@@ -462,22 +588,83 @@ def compute_metrics(graph: DependencyGraph) -> Dict[str, Any]:
     }
 
 
-def graph_to_json_payload(graph: DependencyGraph, metrics: Dict[str, Any], project_root: Path) -> Dict[str, Any]:
+def nodes_by_id(graph: DependencyGraph) -> List[Node]:
+    return sorted(graph.nodes.values(), key=lambda x: x.id)
+
+
+def graph_to_json_payload(
+    graph: DependencyGraph,
+    metrics: Dict[str, Any],
+    project_root: Path,
+    generated_at: Optional[str] = None,
+    sorted_nodes: Optional[List[Node]] = None,
+) -> Dict[str, Any]:
+    if sorted_nodes is None:
+        sorted_nodes = nodes_by_id(graph)
     return {
         "version": "1.0.0",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "project_root": str(project_root),
-        "nodes": [asdict(n) for n in sorted(graph.nodes.values(), key=lambda x: x.id)],
-        "edges": [asdict(e) for e in graph.edges],
+        "nodes": [n.to_dict() for n in sorted_nodes],
+        "edges": [e.to_dict() for e in graph.edges],
         "adjacency": {
             "forward": {k: sorted(v) for k, v in sorted(graph.forward.items())},
             "reverse": {k: sorted(v) for k, v in sorted(graph.reverse.items())},
         },
-        "issues": [asdict(i) for i in graph.issues],
+        "issues": [i.to_dict() for i in graph.issues],
         "metrics": metrics,
     }
 
 
+def encode_json(value: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(", ", ": ")).encode("utf-8")
+
+
+def write_json_array(fh: BinaryIO, values: Iterable[Any], pad: bytes) -> None:
+    sep = b"["
+    for value in values:
+        fh.write(sep + b"\n" + pad + b"  " + encode_json(value))
+        sep = b","
+    fh.write(b"[]" if sep == b"[" else b"\n" + pad + b"]")
+
+
+def write_json_object(fh: BinaryIO, items: Iterable[Tuple[str, Any]], pad: bytes) -> None:
+    sep = b"{"
+    for key, value in items:
+        fh.write(sep + b"\n" + pad + b"  " + encode_json(key) + b": " + encode_json(value))
+        sep = b","
+    fh.write(b"{}" if sep == b"{" else b"\n" + pad + b"}")
+
+
+def write_graph_json(
+    graph_path: Path,
+    graph: DependencyGraph,
+    metrics: Dict[str, Any],
+    project_root: Path,
+    generated_at: str,
+    sorted_nodes: List[Node],
+) -> None:
+    # Streams graph_to_json_payload's structure one element per line instead of materializing it.
+    with graph_path.open("wb") as fh:
+        fh.write(b'{\n  "version": "1.0.0",\n  "generated_at": ' + encode_json(generated_at))
+        fh.write(b',\n  "project_root": ' + encode_json(str(project_root)))
+        fh.write(b',\n  "nodes": ')
+        write_json_array(fh, (n.to_dict() for n in sorted_nodes), b"  ")
+        fh.write(b',\n  "edges": ')
+        write_json_array(fh, (e.to_dict() for e in graph.edges), b"  ")
+        fh.write(b',\n  "adjacency": {\n    "forward": ')
+        write_json_object(fh, ((k, sorted(v)) for k, v in sorted(graph.forward.items())), b"    ")
+        fh.write(b',\n    "reverse": ')
+        write_json_object(fh, ((k, sorted(v)) for k, v in sorted(graph.reverse.items())), b"    ")
+        fh.write(b'\n  },\n  "issues": ')
+        write_json_array(fh, (i.to_dict() for i in graph.issues), b"  ")
+        fh.write(b',\n  "metrics": ' + encode_json(metrics, pretty=True).replace(b"\n", b"\n  ") + b"\n}\n")
+
+
 def to_simple_yaml(data: Any, indent: int = 0) -> str:
     pad = "  " * indent
     if isinstance(data, dict):
@@ -516,7 +703,17 @@ def yaml_scalar(value: Any) -> str:
     return s
 
 
-def generate_markdown_report(graph: DependencyGraph, metrics: Dict[str, Any]) -> str:
+def render_yaml(payload: Dict[str, Any]) -> str:
+    if CSafeDumper is not None:
+        return yaml_dump(payload, Dumper=CSafeDumper, sort_keys=False, allow_unicode=True, default_flow_style=False)
+    return to_simple_yaml(payload) + "\n"
+
+
+def generate_markdown_report(
+    graph: DependencyGraph,
+    metrics: Dict[str, Any],
+    config_nodes: Optional[List[Node]] = None,
+) -> str:
     lines: List[str] = []
     lines.append("# Project Dependency Analysis\n")
     lines.append("> Report generated from explicit directed dependency graph.\n")
@@ -561,7 +758,8 @@ def generate_markdown_report(graph: DependencyGraph, metrics: Dict[str, Any]) ->
     lines.append("")
 
     lines.append("## Config File Access\n")
-    config_nodes = sorted([n for n in graph.nodes.values() if n.kind == "config_file"], key=lambda n: n.id)
+    if config_nodes is None:
+        config_nodes = [n for n in nodes_by_id(graph) if n.kind == "config_file"]
     if not config_nodes:
         lines.append("- No config file access detected.\n")
     else:
@@ -589,18 +787,20 @@ def write_outputs(project_root: Path, markdown_output: Path, graph: DependencyGr
     graph_path = markdown_output.parent / "dependencies_graph.json"
     metrics_path = markdown_output.parent / "architecture_metrics.yaml"
 
-    json_payload = graph_to_json_payload(graph, metrics, project_root)
-    graph_path.write_text(json.dumps(json_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    generated_at = datetime.now(timezone.utc).isoformat()
+    sorted_nodes = nodes_by_id(graph)
+    write_graph_json(graph_path, graph, metrics, project_root, generated_at, sorted_nodes)
 
     metrics_payload = {
         "version": "1.0.0",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at,
         "project_root": str(project_root),
         **metrics,
     }
-    metrics_path.write_text(to_simple_yaml(metrics_payload) + "\n", encoding="utf-8")
+    metrics_path.write_text(render_yaml(metrics_payload), encoding="utf-8")
 
-    markdown = generate_markdown_report(graph, metrics)
+    config_nodes = [n for n in sorted_nodes if n.kind == "config_file"]
+    markdown = generate_markdown_report(graph, metrics, config_nodes)
     markdown_output.write_text(markdown, encoding="utf-8")
 
     print(f"Report generated: {markdown_output}")
@@ -612,6 +812,12 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Analyze Python dependencies and generate markdown report")
     parser.add_argument("--project-root", help="Optional project root override")
     parser.add_argument("--output", help="Optional report output path")
+    parser.add_argument(
+        "--read-workers",
+        type=int,
+        default=0,
+        help="Prefetch source files on this many threads while parsing (default: 0, sequential reads)",
+    )
     args = parser.parse_args()
 
     project_root = Path(args.project_root).resolve() if args.project_root else find_project_root(Path(__file__).resolve().parent)
@@ -625,12 +831,12 @@ def main() -> int:
     else:
         print("Warning: .gitignore not found")
 
-    py_files = discover_python_files(project_root, gitignore_spec, fallback_patterns)
+    py_files = discover_python_files(project_root, gitignore_spec, compile_fallback_patterns(fallback_patterns))
     if not py_files:
         print("No Python modules found in project")
         return 1
 
-    graph = build_dependency_graph(project_root, py_files)
+    graph = build_dependency_graph(project_root, py_files, read_workers=args.read_workers)
     metrics = compute_metrics(graph)
 
     print(f"Analyzed {metrics['summary']['internal_modules']} Python modules")
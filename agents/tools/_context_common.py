@@ -6,14 +6,18 @@ Shared context/path helpers for context loader tools.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
 
 try:
     import yaml
 except Exception as exc:  # pragma: no cover
     raise SystemExit(f"PyYAML required: {exc}")
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
@@ -47,7 +51,24 @@ def resolve_and_validate(path: str, *, must_exist: bool) -> Path:
 def load_yaml_file(path: str | Path) -> Any:
     p = resolve_path(str(path)) if isinstance(path, str) else path
     with open(p, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@lru_cache(maxsize=1)
+def load_framework_config() -> Dict[str, Any]:
+    """Parse agent_framework_config.yaml once per process; {} if missing or unreadable.
+
+    The result is shared, so treat it as read-only. Call
+    load_framework_config.cache_clear() after editing the file in-process.
+    """
+    config_path = project_root() / "agent_framework_config.yaml"
+    if not config_path.exists():
+        return {}
+    try:
+        data = load_yaml_file(config_path)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
 def load_json_file(path: str | Path) -> Any:
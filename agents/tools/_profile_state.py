@@ -15,8 +15,25 @@ try:
 except Exception as exc:  # pragma: no cover
     raise SystemExit(f"PyYAML required: {exc}")
 
+try:
+    from agents.tools._yaml_cache import StatCache
+except ImportError:
+    from _yaml_cache import StatCache  # type: ignore
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
-VALID_PROFILES = {"LITE", "STANDARD", "FULL"}
+VALID_PROFILES = frozenset({"LITE", "STANDARD", "FULL"})
+
+
+def _parse_yaml(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+# Profiles are re-read on every inheritance walk; merges mutate the copies handed out.
+_yaml_cache = StatCache("_profile_state", _parse_yaml)
 
 
 def project_root() -> Path:
@@ -24,10 +41,11 @@ def project_root() -> Path:
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _yaml_cache.load(path, st)
     return data if isinstance(data, dict) else {}
 
 
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Stat-validated cache for parsed YAML files shared by agent_tools scripts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+
+class StatCache:
+    """Parsed file contents keyed by path and revalidated against (mtime_ns, size).
+
+    Callers always get a deep copy, so in-place edits never leak into the cache.
+    Set TINKER_YAML_CACHE_STATS=1 to print hit/miss counts to stderr at exit.
+    """
+
+    def __init__(self, label: str, parse: Callable[[Path], Any]) -> None:
+        self.label = label
+        self._parse = parse
+        self._entries: Dict[str, Tuple[int, int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if os.environ.get("TINKER_YAML_CACHE_STATS") == "1":
+            atexit.register(self._report)
+
+    def load(self, path: Path, st: os.stat_result) -> Any:
+        key = str(path)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self.hits += 1
+            data = cached[2]
+        else:
+            self.misses += 1
+            data = self._parse(path)
+            self._entries[key] = (st.st_mtime_ns, st.st_size, data)
+        return copy.deepcopy(data)
+
+    def discard(self, path: Path) -> None:
+        self._entries.pop(str(path), None)
+
+    def _report(self) -> None:
+        print(f"[{self.label}] yaml cache hits={self.hits} misses={self.misses}", file=sys.stderr)
@@ -8,15 +8,23 @@ Current supported intents:
 - commit and sync
 - init
 - full context
+
+Intent text is matched on whole words against the longest known alias
+prefix, so trailing words are tolerated ("commit please" -> commit).
 """
 
 from __future__ import annotations
 
 import argparse
+import importlib
+import os
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 try:
     from agents.tools._repo_root import find_project_root
@@ -24,7 +32,7 @@ except ImportError:
     from _repo_root import find_project_root  # type: ignore
 
 
-INTENT_ALIASES = {
+INTENT_ALIASES = MappingProxyType({
     "commit": "commit",
     "checkpoint": "commit",
     "sync": "sync",
@@ -40,7 +48,33 @@ INTENT_ALIASES = {
     "refresh full context": "full-context",
     "build full context": "full-context",
     "context full": "full-context",
-}
+})
+
+
+def build_intent_trie(aliases: Mapping[str, str]) -> dict:
+    trie: dict = {}
+    for alias, intent in aliases.items():
+        node = trie
+        for word in alias.split():
+            node = node.setdefault(word, {})
+        node[None] = intent
+    return trie
+
+
+INTENT_TRIE = build_intent_trie(INTENT_ALIASES)
+_VALID_INTENTS_MSG = ", ".join(sorted(INTENT_ALIASES))
+
+_PY = Path(sys.executable)
+
+
+@lru_cache(maxsize=1)
+def _root() -> Path:
+    return find_project_root(Path(__file__).resolve().parent)
+
+
+@lru_cache(maxsize=None)
+def _tool(name: str) -> Path:
+    return _root() / "agents" / "tools" / name
 
 
 def now_checkpoint_message() -> str:
@@ -48,9 +82,19 @@ def now_checkpoint_message() -> str:
     return f"checkpoint: chat shortcut {stamp}"
 
 
+@lru_cache(maxsize=64)
 def normalize_intent(raw: str) -> str:
-    cleaned = " ".join(raw.strip().lower().replace("_", " ").split())
-    return INTENT_ALIASES.get(cleaned, "")
+    hit = INTENT_ALIASES.get(raw)
+    if hit:
+        return hit
+    match = ""
+    node = INTENT_TRIE
+    for word in raw.strip().lower().replace("_", " ").split():
+        node = node.get(word)
+        if node is None:
+            break
+        match = node.get(None, match)
+    return match
 
 
 def run_cmd(args: list[str], cwd: Path) -> int:
@@ -58,6 +102,51 @@ def run_cmd(args: list[str], cwd: Path) -> int:
     return int(proc.returncode)
 
 
+def exec_cmd(args: list[str], cwd: Path) -> int:
+    """Replace this process with the command; Windows has no real exec, so it runs a child there."""
+    if os.name == "nt":
+        return run_cmd(args, cwd)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.chdir(cwd)
+    os.execvp(args[0], args)
+    return 1  # unreachable: execvp only returns by raising
+
+
+def run_tool_inproc(module_name: str, argv: list[str], cwd: Path) -> int | None:
+    """Run agents/tools/<module_name>.py main() in this interpreter; None if it cannot be imported."""
+    try:
+        module = importlib.import_module(f"agents.tools.{module_name}")
+    except ImportError:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            return None
+
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [f"{module_name}.py", *argv]
+    os.chdir(cwd)
+    try:
+        code = module.main()
+    except SystemExit as exc:
+        code = exc.code
+        if code is not None and not isinstance(code, int):
+            print(code, file=sys.stderr)
+            code = 1
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+    return int(code or 0)
+
+
+def run_tool(module_name: str, argv: list[str], root: Path, inproc: bool = True) -> int:
+    if inproc:
+        code = run_tool_inproc(module_name, argv, root)
+        if code is not None:
+            return code
+    return run_cmd([str(_PY), str(_tool(f"{module_name}.py")), *argv], root)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run chat shortcut intents (init/commit/sync/full-context)")
     parser.add_argument(
@@ -101,56 +190,57 @@ def main() -> int:
         action="store_true",
         help="Include treemap in full-context intent",
     )
+    parser.add_argument(
+        "--no-inproc",
+        action="store_true",
+        help="Run init/full-context steps as separate Python processes instead of in this interpreter",
+    )
     args = parser.parse_args()
 
     resolved = normalize_intent(args.intent)
     if not resolved:
-        valid = ", ".join(sorted(set(INTENT_ALIASES.keys())))
-        raise SystemExit(f"Unknown intent: {args.intent!r}. Supported intents: {valid}")
+        raise SystemExit(f"Unknown intent: {args.intent!r}. Supported intents: {_VALID_INTENTS_MSG}")
 
-    root = find_project_root(Path(__file__).resolve().parent)
-    runner = root / "agents" / "tools" / "git_checkpoint.py"
-    py = Path(sys.executable)
+    root = _root()
+    runner = _tool("git_checkpoint.py")
+    py = _PY
 
     if resolved == "commit":
         message = args.message or now_checkpoint_message()
-        return run_cmd([str(py), str(runner), "commit", "--message", message], root)
+        return exec_cmd([str(py), str(runner), "commit", "--message", message], root)
 
     if resolved == "sync":
         cmd = [str(py), str(runner), "sync", "--remote", args.remote]
         if args.branch:
             cmd += ["--branch", args.branch]
-        return run_cmd(cmd, root)
+        return exec_cmd(cmd, root)
 
     if resolved == "init":
         profile = args.profile.upper()
         print(f"Initializing Tinker Session [Kernel: {profile}]...")
 
+        inproc = not args.no_inproc
+
         print(f"  [1/4] Activating Kernel ({profile})...")
-        kernel_script = root / "agents" / "tools" / "activate_kernel.py"
-        if run_cmd([str(py), str(kernel_script), "--profile", profile], root) != 0:
+        if run_tool("activate_kernel", ["--profile", profile], root, inproc) != 0:
             return 1
 
         print("  [2/4] Compiling Skill Registry...")
-        compiler_script = root / "agents" / "tools" / "compile_registry.py"
-        if run_cmd([str(py), str(compiler_script)], root) != 0:
+        if run_tool("compile_registry", [], root, inproc) != 0:
             return 1
 
         print("  [3/4] Loading Static Context...")
-        context_script = root / "agents" / "tools" / "load_static_context.py"
-        if run_cmd([str(py), str(context_script)], root) != 0:
+        if run_tool("load_static_context", [], root, inproc) != 0:
             return 1
 
         print("  [4/4] Verifying Mode State...")
-        mode_script = root / "agents" / "tools" / "mode_selector.py"
-        run_cmd([str(py), str(mode_script), "--read-state"], root)
+        run_tool("mode_selector", ["--read-state"], root, inproc)
 
         print("Session initialized. Ready for task execution.")
         return 0
 
     if resolved == "full-context":
         print("Building full context snapshot...")
-        full_context_script = root / "agents" / "tools" / "load_full_context.py"
 
         on_demand_keys: list[str] = ["architecture_metrics", "dependencies_graph"]
         for key in args.on_demand:
@@ -159,9 +249,7 @@ def main() -> int:
         if args.include_treemap and "treemap" not in on_demand_keys:
             on_demand_keys.append("treemap")
 
-        cmd = [
-            str(py),
-            str(full_context_script),
+        tool_args = [
             "--task-plan",
             args.task_plan,
             "--system-config",
@@ -170,8 +258,8 @@ def main() -> int:
             args.summary,
         ]
         for key in on_demand_keys:
-            cmd.extend(["--on-demand", key])
-        return run_cmd(cmd, root)
+            tool_args.extend(["--on-demand", key])
+        return run_tool("load_full_context", tool_args, root, not args.no_inproc)
 
     message = args.message or now_checkpoint_message()
     cmd = [
@@ -185,7 +273,7 @@ def main() -> int:
     ]
     if args.branch:
         cmd += ["--branch", args.branch]
-    return run_cmd(cmd, root)
+    return exec_cmd(cmd, root)
 
 
 if __name__ == "__main__":
@@ -146,6 +146,10 @@ def compile_registry():
     save_yaml(TRIGGER_OUTPUT, current_triggers, header_triggers)
     print(f"Updated {TRIGGER_OUTPUT} with extracted triggers.")
 
-if __name__ == "__main__":
+def main() -> int:
     compile_registry()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
 
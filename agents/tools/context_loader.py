@@ -8,24 +8,52 @@ analysis artifacts only when requested. Structured artifacts can be queried
 without loading their full content to keep token usage low.
 """
 
+import copy
 import json
 import os
-from typing import Any, Dict, List, Optional
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    from agents.tools._context_common import _YAML_LOADER, load_framework_config, project_root
+except ImportError:
+    from _context_common import _YAML_LOADER, load_framework_config, project_root  # type: ignore
 
 try:
-    from agents.tools._context_common import load_yaml_file, project_root
+    import orjson  # type: ignore
 except ImportError:
-    from _context_common import load_yaml_file, project_root  # type: ignore
+    orjson = None  # type: ignore
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> str:
     """Resolve the host project root (parent of agents/tools/)."""
     return str(project_root())
 
 
-_CONFIG_FILENAME = "agent_framework_config.yaml"
 _DEP_ARTIFACT_KEYS = {"dependencies_report", "dependencies_graph", "architecture_metrics"}
 
+# Latest .py mtime per root as (computed_at, mtime); reused for a short window so
+# back-to-back artifact loads (e.g. load_dependency_snapshot) walk the tree once.
+_LATEST_PY_MTIME_TTL_SECONDS = 2.0
+_latest_py_mtime_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+
+# Parsed structured artifacts keyed by absolute path -> (mtime_ns, size, parsed).
+# Cached payloads are shared between calls and must be treated as read-only.
+_parsed_cache: Dict[str, Tuple[int, int, Any]] = {}
+
+# id -> node index for the most recently queried graph "nodes" list, held with the
+# list itself so identity can be checked; a reparsed graph replaces the entry.
+_node_index_cache: Optional[Tuple[List[Any], Dict[str, Any]]] = None
+
+# Sorted "Available: ..." listing for unknown-name errors, held with the registry it describes.
+_available_msg_cache: Optional[Tuple[Dict[str, Dict[str, str]], str]] = None
+
 
 _FALLBACK_REGISTRY: Dict[str, Dict[str, str]] = {
     "treemap": {
@@ -53,16 +81,7 @@ _FALLBACK_REGISTRY: Dict[str, Dict[str, str]] = {
 
 def _load_registry() -> Dict[str, Dict[str, str]]:
     """Load on-demand file registry from agent_framework_config.yaml."""
-    config_path = os.path.join(get_project_root(), _CONFIG_FILENAME)
-    if not os.path.exists(config_path):
-        return dict(_FALLBACK_REGISTRY)
-
-    try:
-        config = load_yaml_file(config_path) or {}
-    except Exception:
-        return dict(_FALLBACK_REGISTRY)
-
-    on_demand = config.get("on_demand_files")
+    on_demand = load_framework_config().get("on_demand_files")
     if not isinstance(on_demand, dict) or not on_demand:
         return dict(_FALLBACK_REGISTRY)
 
@@ -78,14 +97,16 @@ def _load_registry() -> Dict[str, Dict[str, str]]:
     return registry if registry else dict(_FALLBACK_REGISTRY)
 
 
-_registry_cache: Dict[str, Dict[str, str]] = {}
+@lru_cache(maxsize=1)
+def _get_registry() -> Dict[str, Dict[str, str]]:
+    return _load_registry()
 
 
-def _get_registry() -> Dict[str, Dict[str, str]]:
-    global _registry_cache
-    if not _registry_cache:
-        _registry_cache = _load_registry()
-    return _registry_cache
+def _available_msg(registry: Dict[str, Dict[str, str]]) -> str:
+    global _available_msg_cache
+    if _available_msg_cache is None or _available_msg_cache[0] is not registry:
+        _available_msg_cache = (registry, ", ".join(sorted(registry)))
+    return _available_msg_cache[1]
 
 
 def list_available() -> List[str]:
@@ -104,38 +125,89 @@ def _normalize_format(raw_fmt: str) -> str:
     return val or "unknown"
 
 
-def _file_metadata(abs_path: str, rel_path: str, result: Dict[str, Any]) -> Optional[str]:
-    if not os.path.exists(abs_path):
+def _file_metadata(
+    abs_path: str, rel_path: str, result: Dict[str, Any]
+) -> Optional[Tuple[bytes, os.stat_result]]:
+    try:
+        st = os.stat(abs_path)
+    except OSError:
         result["exists"] = False
         result["error"] = f"File not found: {rel_path}"
         return None
     result["exists"] = True
-    result["size_bytes"] = os.path.getsize(abs_path)
+    result["size_bytes"] = st.st_size
     try:
-        with open(abs_path, "r", encoding="utf-8") as handle:
-            text = handle.read()
-        result["line_count"] = text.count("\n") + 1
-        return text
-    except (IOError, UnicodeDecodeError) as exc:
+        with open(abs_path, "rb") as handle:
+            data = handle.read()
+    except IOError as exc:
         result["error"] = f"Failed to read {rel_path}: {exc}"
         return None
+    # Counting on the raw bytes avoids decoding artifacts that are only parsed.
+    result["line_count"] = data.count(b"\n") + 1
+    return data, st
 
 
 def _collect_latest_python_mtime(root: str) -> Optional[float]:
+    cached = _latest_py_mtime_cache.get(root)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _LATEST_PY_MTIME_TTL_SECONDS:
+        return cached[1]
+    latest = _git_latest_python_mtime(root)
+    if latest is None:
+        latest = _scan_latest_python_mtime(root)
+    _latest_py_mtime_cache[root] = (now, latest)
+    return latest
+
+
+_MTIME_SCAN_EXCLUDED_DIRS = frozenset({".git", "__pycache__", ".venv", "venv", ".pytest_cache"})
+
+
+def _git_latest_python_mtime(root: str) -> Optional[float]:
+    """Newest mtime over tracked and unignored untracked .py files; None outside a git work tree."""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", root, "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "*.py"],
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
     latest: Optional[float] = None
-    excluded_dirs = {".git", "__pycache__", ".venv", "venv", ".pytest_cache"}
-    for current_root, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in excluded_dirs]
-        for filename in files:
-            if not filename.endswith(".py"):
-                continue
-            full_path = os.path.join(current_root, filename)
-            try:
-                mtime = os.path.getmtime(full_path)
-            except OSError:
-                continue
-            if latest is None or mtime > latest:
-                latest = mtime
+    for rel in proc.stdout.split(b"\0"):
+        if not rel:
+            continue
+        try:
+            mtime = os.stat(os.path.join(root, os.fsdecode(rel))).st_mtime
+        except OSError:
+            continue
+        if latest is None or mtime > latest:
+            latest = mtime
+    return latest
+
+
+def _scan_latest_python_mtime(root: str) -> Optional[float]:
+    latest: Optional[float] = None
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _MTIME_SCAN_EXCLUDED_DIRS:
+                            pending.append(entry.path)
+                        continue
+                    if not entry.name.endswith(".py"):
+                        continue
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if latest is None or mtime > latest:
+                    latest = mtime
     return latest
 
 
@@ -158,30 +230,71 @@ def _staleness_info(name: str, artifact_path: str) -> Dict[str, Any]:
     }
 
 
-def _slice_top_lists(payload: Dict[str, Any], top_n: Optional[int]) -> Dict[str, Any]:
+def _parse_structured(abs_path: str, fmt: str, data: bytes, stat: os.stat_result) -> Any:
+    # `stat` was taken before `data` was read, so a file changed in between only costs a re-parse.
+    cached = _parsed_cache.get(abs_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    if fmt == "json":
+        parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+    else:
+        parsed = yaml.load(data, Loader=_YAML_LOADER)
+    _parsed_cache[abs_path] = (stat.st_mtime_ns, stat.st_size, parsed)
+    return parsed
+
+
+def _slice_top_lists(payload: Dict[str, Any], top_n: Optional[int], owned: bool = False) -> Dict[str, Any]:
+    """Truncate top-N lists; `owned` payloads are updated in place instead of copied."""
     if top_n is None:
         return payload
     if top_n <= 0:
         raise ValueError("top_n must be a positive integer")
 
-    out = dict(payload)
-    degree = out.get("degree_metrics")
+    # Payloads may be shared with the parse cache: copy only the containers that get truncated.
+    out = payload
+    shared = not owned
+    degree = payload.get("degree_metrics")
     if isinstance(degree, dict):
-        degree = dict(degree)
-        for key in ["top_fan_in", "top_fan_out"]:
+        truncated = {}
+        for key in ("top_fan_in", "top_fan_out"):
             value = degree.get(key)
-            if isinstance(value, list):
-                degree[key] = value[:top_n]
-        out["degree_metrics"] = degree
-
-    cycles = out.get("cycles")
-    if isinstance(cycles, dict) and isinstance(cycles.get("sccs"), list):
-        cycles = dict(cycles)
-        cycles["sccs"] = cycles["sccs"][:top_n]
-        out["cycles"] = cycles
+            if isinstance(value, list) and len(value) > top_n:
+                truncated[key] = value[:top_n]
+        if truncated:
+            if shared:
+                out, shared = dict(payload), False
+            out["degree_metrics"] = {**degree, **truncated}
+
+    cycles = payload.get("cycles")
+    if isinstance(cycles, dict) and isinstance(cycles.get("sccs"), list) and len(cycles["sccs"]) > top_n:
+        if shared:
+            out = dict(payload)
+        out["cycles"] = {**cycles, "sccs": cycles["sccs"][:top_n]}
     return out
 
 
+_COMPACT_METRIC_KEYS = ("summary", "degree_metrics", "entrypoints", "cycles")
+
+
+def _compact_metrics(metrics: Dict[str, Any], top_n: int) -> Dict[str, Any]:
+    # The projection is a fresh dict, so slicing can update it in place.
+    compact = {key: metrics.get(key, {}) for key in _COMPACT_METRIC_KEYS}
+    return _slice_top_lists(compact, top_n, owned=True)
+
+
+def _nodes_by_id(nodes: List[Any]) -> Dict[str, Any]:
+    global _node_index_cache
+    if _node_index_cache is not None and _node_index_cache[0] is nodes:
+        return _node_index_cache[1]
+    index: Dict[str, Any] = {}
+    for node in nodes:
+        if isinstance(node, dict):
+            # First occurrence wins, as with the linear scan this replaces.
+            index.setdefault(node.get("id"), node)
+    _node_index_cache = (nodes, index)
+    return index
+
+
 def _module_snapshot(graph: Dict[str, Any], module: str) -> Dict[str, Any]:
     module_id = module if module.startswith("module:") else f"module:{module}"
     nodes = graph.get("nodes", [])
@@ -189,12 +302,7 @@ def _module_snapshot(graph: Dict[str, Any], module: str) -> Dict[str, Any]:
     forward = adjacency.get("forward", {}) if isinstance(adjacency, dict) else {}
     reverse = adjacency.get("reverse", {}) if isinstance(adjacency, dict) else {}
 
-    node_entry = None
-    if isinstance(nodes, list):
-        for node in nodes:
-            if isinstance(node, dict) and node.get("id") == module_id:
-                node_entry = node
-                break
+    node_entry = _nodes_by_id(nodes).get(module_id) if isinstance(nodes, list) else None
 
     return {
         "module": module_id,
@@ -243,24 +351,13 @@ def _extract_structured(
         return {"data": section_payload}
 
     if name == "architecture_metrics":
-        compact = {
-            "summary": data.get("summary", {}),
-            "degree_metrics": data.get("degree_metrics", {}),
-            "entrypoints": data.get("entrypoints", {}),
-            "cycles": data.get("cycles", {}),
-        }
-        return {"data": _slice_top_lists(compact, top_n or 10)}
+        return {"data": _compact_metrics(data, top_n or 10)}
 
     if name == "dependencies_graph":
         metrics = data.get("metrics", {}) if isinstance(data.get("metrics"), dict) else {}
-        compact = {
-            "summary": metrics.get("summary", {}),
-            "degree_metrics": metrics.get("degree_metrics", {}),
-            "entrypoints": metrics.get("entrypoints", {}),
-            "cycles": metrics.get("cycles", {}),
-            "issues_count": len(data.get("issues", [])) if isinstance(data.get("issues"), list) else 0,
-        }
-        return {"data": _slice_top_lists(compact, top_n or 10)}
+        compact = _compact_metrics(metrics, top_n or 10)
+        compact["issues_count"] = len(data.get("issues", [])) if isinstance(data.get("issues"), list) else 0
+        return {"data": compact}
 
     return {"data": data}
 
@@ -272,12 +369,16 @@ def load_on_demand(
     top_n: Optional[int] = None,
     scc_index: Optional[int] = None,
     include_content: Optional[bool] = None,
+    check_staleness: bool = True,
 ) -> Dict[str, Any]:
-    """Load one on-demand file by logical name, with optional selective query."""
+    """Load one on-demand file by logical name, with optional selective query.
+
+    check_staleness=False skips the stale/recommended_command fields for callers
+    that already know the artifact's freshness.
+    """
     registry = _get_registry()
     if name not in registry:
-        available = ", ".join(sorted(registry.keys()))
-        raise KeyError(f"Unknown on-demand file '{name}'. Available: {available}")
+        raise KeyError(f"Unknown on-demand file '{name}'. Available: {_available_msg(registry)}")
 
     entry = registry[name]
     rel_path = entry["path"]
@@ -297,36 +398,47 @@ def load_on_demand(
         },
     }
 
-    text = _file_metadata(abs_path, rel_path, result)
-    if text is None:
+    loaded = _file_metadata(abs_path, rel_path, result)
+    if loaded is None:
         return result
+    data, stat = loaded
 
-    result.update(_staleness_info(name, abs_path))
+    if check_staleness:
+        result.update(_staleness_info(name, abs_path))
 
     structured = fmt in {"json", "yaml"}
     if include_content is None:
         include_content = not structured
 
     if include_content:
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            result["error"] = f"Failed to read {rel_path}: {exc}"
+            return result
+        if "\r" in text:
+            # Match the universal-newline translation of a text-mode read.
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
         result["content"] = text
 
     if not structured:
         return result
 
     try:
-        parsed: Any
-        if fmt == "json":
-            parsed = json.loads(text)
-        else:
-            parsed = load_yaml_file(abs_path)
+        parsed = _parse_structured(abs_path, fmt, data, stat)
     except Exception as exc:
         result["error"] = f"Failed to parse {fmt} content from {rel_path}: {exc}"
         return result
 
     try:
-        result.update(_extract_structured(name, parsed, section, module, top_n, scc_index))
+        extracted = _extract_structured(name, parsed, section, module, top_n, scc_index)
     except ValueError as exc:
         result["error"] = str(exc)
+        return result
+
+    # The parsed artifact is cached and shared across calls; copy only the slice handed out, so
+    # callers may edit their result without corrupting later loads.
+    result.update(copy.deepcopy(extracted))
 
     return result
 
@@ -338,7 +450,13 @@ def load_dependency_snapshot(profile: str = "compact", top_n: int = 10) -> Dict[
     profile='debug' includes additional structured sections.
     """
     metrics_result = load_on_demand("architecture_metrics", top_n=top_n)
-    graph_issues_result = load_on_demand("dependencies_graph", section="issues")
+    # Both artifacts come from the same analyzer run, so the metrics staleness
+    # answers for the graph too; only check the graph when metrics are missing.
+    graph_issues_result = load_on_demand(
+        "dependencies_graph",
+        section="issues",
+        check_staleness="stale" not in metrics_result,
+    )
 
     snapshot: Dict[str, Any] = {
         "profile": profile,
@@ -385,8 +503,14 @@ def enrich_context(base_context: Dict[str, Any], file_names: List[str]) -> Dict[
     enriched = dict(base_context)
     on_demand_data: Dict[str, Any] = {}
 
-    for name in file_names:
-        on_demand_data[name] = load_on_demand(name)
+    if len(file_names) > 1:
+        # Warm the shared registry once so the workers do not race to load it.
+        _get_registry()
+        with ThreadPoolExecutor(max_workers=min(8, len(file_names))) as executor:
+            on_demand_data.update(zip(file_names, executor.map(load_on_demand, file_names)))
+    else:
+        for name in file_names:
+            on_demand_data[name] = load_on_demand(name)
 
     enriched["_on_demand"] = {
         "_note": "Temporary on-demand data. NOT persisted to context.json.",
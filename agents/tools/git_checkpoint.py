@@ -33,29 +33,33 @@ def run_git(args: list[str], cwd: Path) -> tuple[int, str, str]:
     return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
 
 
-def current_branch(cwd: Path) -> str:
-    rc, out, err = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd)
-    if rc != 0:
-        raise SystemExit(f"Failed to resolve current branch: {err or out}")
-    branch = out.strip()
-    if not branch:
-        raise SystemExit("Current branch is empty.")
-    return branch
-
-
-def has_pending_changes(cwd: Path) -> bool:
+def git_status(cwd: Path) -> str:
     rc, out, err = run_git(["status", "--porcelain"], cwd)
     if rc != 0:
         raise SystemExit(f"Failed to inspect git status: {err or out}")
-    return bool(out.strip())
+    return out
 
 
-def commit_changes(cwd: Path, message: str) -> None:
-    rc, _, err = run_git(["add", "-A"], cwd)
-    if rc != 0:
-        raise SystemExit(f"git add failed: {err}")
+def has_pending_changes(cwd: Path) -> tuple[bool, str]:
+    status = git_status(cwd)
+    return bool(status.strip()), status
+
+
+def has_untracked(status: str) -> bool:
+    return any(line.startswith("??") for line in status.splitlines())
+
+
+def commit_changes(cwd: Path, message: str, status: str | None = None) -> None:
+    # With a known status and no untracked files, `commit -a` stages everything `add -A` would.
+    if status is not None and not has_untracked(status):
+        commit_args = ["commit", "-a", "-m", message]
+    else:
+        rc, _, err = run_git(["add", "-A"], cwd)
+        if rc != 0:
+            raise SystemExit(f"git add failed: {err}")
+        commit_args = ["commit", "-m", message]
 
-    rc, out, err = run_git(["commit", "-m", message], cwd)
+    rc, out, err = run_git(commit_args, cwd)
     if rc != 0:
         if "nothing to commit" in (out + "\n" + err).lower():
             print("No changes to commit.")
@@ -65,11 +69,11 @@ def commit_changes(cwd: Path, message: str) -> None:
 
 
 def push_changes(cwd: Path, remote: str, branch: str | None) -> None:
-    target_branch = branch or current_branch(cwd)
-    rc, out, err = run_git(["push", remote, target_branch], cwd)
+    # HEAD pushes the current branch to its same-named remote branch without a rev-parse round-trip.
+    rc, out, err = run_git(["push", remote, branch or "HEAD"], cwd)
     if rc != 0:
         raise SystemExit(f"git push failed: {err or out}")
-    print(out or f"Pushed to {remote}/{target_branch}")
+    print(out or (f"Pushed to {remote}/{branch}" if branch else f"Pushed current branch to {remote}"))
 
 
 def main() -> int:
@@ -92,10 +96,11 @@ def main() -> int:
     root = find_project_root(Path(__file__).resolve().parent)
 
     if args.command == "commit":
-        if not has_pending_changes(root):
+        pending, status = has_pending_changes(root)
+        if not pending:
             print("No changes to commit.")
             return 0
-        commit_changes(root, args.message)
+        commit_changes(root, args.message, status)
         return 0
 
     if args.command == "sync":
@@ -103,8 +108,9 @@ def main() -> int:
         return 0
 
     if args.command == "commit-sync":
-        if has_pending_changes(root):
-            commit_changes(root, args.message)
+        pending, status = has_pending_changes(root)
+        if pending:
+            commit_changes(root, args.message, status)
         else:
             print("No changes to commit; continuing to push.")
         push_changes(root, args.remote, args.branch)
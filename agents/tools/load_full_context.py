@@ -11,9 +11,16 @@ Build a consolidated context JSON from:
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 try:
     from ._context_common import load_json_file, load_yaml_file, resolve_and_validate
     from .context_loader import enrich_context
@@ -31,17 +38,23 @@ def load_full_context(
     on_demand: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Load static + dynamic context, optionally enriched with on-demand files."""
-    context = load_static_context()
-    dynamic_context: Dict[str, Any] = {}
-
     task_plan_abs = resolve_and_validate(task_plan_path, must_exist=True)
-    dynamic_context["task_plan"] = load_json_file(task_plan_abs)
-
     system_config_abs = resolve_and_validate(system_config_path, must_exist=True)
-    dynamic_context["system_config"] = load_yaml_file(system_config_abs)
-
     summary_abs = resolve_and_validate(summary_path, must_exist=True)
-    dynamic_context["summary"] = load_yaml_file(summary_abs)
+
+    # The four loads are independent file reads; overlap them and collect in a fixed order.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        static_future = executor.submit(load_static_context)
+        task_plan_future = executor.submit(load_json_file, task_plan_abs)
+        system_config_future = executor.submit(load_yaml_file, system_config_abs)
+        summary_future = executor.submit(load_yaml_file, summary_abs)
+
+        context = static_future.result()
+        dynamic_context: Dict[str, Any] = {
+            "task_plan": task_plan_future.result(),
+            "system_config": system_config_future.result(),
+            "summary": summary_future.result(),
+        }
 
     full_context = {**context, **dynamic_context}
 
@@ -51,11 +64,33 @@ def load_full_context(
     return full_context
 
 
-def save_context_as_json(full_context: Dict[str, Any], output_path: str = "agents/logic/agent_outputs/context.json") -> None:
+def encode_context(full_context: Dict[str, Any], compact: bool = False) -> bytes:
+    if orjson is not None:
+        # YAML-sourced sections may carry int keys, which orjson rejects without OPT_NON_STR_KEYS.
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(full_context, option=option)
+    if compact:
+        return json.dumps(full_context, separators=(",", ":")).encode("utf-8")
+    return json.dumps(full_context, indent=2).encode("utf-8")
+
+
+def save_context_as_json(
+    full_context: Dict[str, Any],
+    output_path: str = "agents/logic/agent_outputs/context.json",
+    compact: bool = False,
+    gzip_output: bool = False,
+) -> None:
+    if gzip_output and not output_path.endswith(".gz"):
+        output_path += ".gz"
     output_abs = resolve_and_validate(output_path, must_exist=False)
     output_abs.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_abs, "w", encoding="utf-8") as f:
-        json.dump(full_context, f, indent=2)
+    payload = encode_context(full_context, compact=compact)
+    if gzip_output:
+        # Level 1 keeps compression nearly free while still shrinking JSON several-fold.
+        with gzip.open(output_abs, "wb", compresslevel=1) as f:
+            f.write(payload)
+    else:
+        output_abs.write_bytes(payload)
     print(f"Full context saved as JSON: {output_abs}")
 
 
@@ -87,6 +122,16 @@ def main() -> int:
         default="agents/logic/agent_outputs/context.json",
         help="Output context JSON path",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write JSON without indentation (smaller, for machine consumers)",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the output; '.gz' is appended to --output if missing",
+    )
     args = parser.parse_args()
 
     full_context = load_full_context(
@@ -95,7 +140,7 @@ def main() -> int:
         summary_path=args.summary,
         on_demand=args.on_demand or None,
     )
-    save_context_as_json(full_context, output_path=args.output)
+    save_context_as_json(full_context, output_path=args.output, compact=args.compact, gzip_output=args.gzip)
     return 0
 
 
@@ -31,18 +31,15 @@ import json
 import argparse
 from typing import Dict, Any, List, Optional
 
+try:
+    from agents.tools._context_common import load_framework_config
+except ImportError:
+    from _context_common import load_framework_config  # type: ignore
+
 
 def _load_framework_config() -> Dict[str, Any]:
     """Load agent_framework_config.yaml from the project root. Returns {} on failure."""
-    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    config_path = os.path.join(root, "agent_framework_config.yaml")
-    if not os.path.exists(config_path):
-        return {}
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    except Exception:
-        return {}
+    return load_framework_config()
 
 
 # Paths relativos dentro del proyecto
@@ -862,8 +859,7 @@ def save_static_context_as_json(
     print(f"  Lines: {line_count:,}")
 
 
-# Ejecución de prueba
-if __name__ == "__main__":
+def main() -> int:
     parser = argparse.ArgumentParser(
         description="Generate compact static context for Tinker.",
     )
@@ -897,13 +893,9 @@ if __name__ == "__main__":
             f"  Context budget: {budget.get('final_lines', '?')}/{budget.get('max_lines', '?')} lines"
             f" (truncated={budget.get('truncation_applied', False)})"
         )
+    return 0
 
 
-
-
-
-
-
-
-
-
+# Ejecución de prueba
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,11 @@ import argparse
 import json
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 try:
     from agents.tools._profile_state import (
         VALID_PROFILES,
@@ -38,13 +43,27 @@ except ImportError:
     )
 
 
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        # Kernel/profile YAML may use non-string keys, which orjson rejects by default.
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
 def deep_merge(base: dict, override: dict) -> dict:
     merged = dict(base)
-    for key, value in override.items():
-        if isinstance(merged.get(key), dict) and isinstance(value, dict):
-            merged[key] = deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+    # Work stack of (destination, override) pairs; only dicts that are merged into get copied.
+    stack = [(merged, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                nested = dict(current)
+                dst[key] = nested
+                stack.append((nested, value))
+            else:
+                dst[key] = value
     return merged
 
 
@@ -60,10 +79,10 @@ def main() -> int:
         state_path = resolve_state_path(args.agent_id)
         state = load_state(state_path)
         if not state:
-            print(json.dumps({"state_path": str(state_path), "status": "missing"}, indent=2))
+            print(dumps({"state_path": str(state_path), "status": "missing"}))
             return 0
         state.setdefault("_state_path", str(state_path))
-        print(json.dumps(state, indent=2))
+        print(dumps(state))
         return 0
 
     user_task = load_yaml(project_root() / args.user_task)
@@ -85,7 +104,11 @@ def main() -> int:
         raise SystemExit(f"Profile file not found: {profile_path}")
     profile = load_yaml(profile_path)
 
-    bundle = deep_merge(kernel, profile)
+    # Without a key that is a mapping on both sides, the merge is a plain top-level override.
+    if any(isinstance(kernel[key], dict) and isinstance(profile[key], dict) for key in kernel.keys() & profile.keys()):
+        bundle = deep_merge(kernel, profile)
+    else:
+        bundle = {**kernel, **profile}
     bundle["_resolved_profile"] = requested
     bundle["_resolved_at"] = now_iso()
 
@@ -93,9 +116,9 @@ def main() -> int:
         state_path = resolve_state_path(args.agent_id)
         state_payload = write_state(state_path, requested, agent_id=args.agent_id, source="mode_selector")
         state_payload["updated_at"] = bundle["_resolved_at"]
-        state_path.write_text(json.dumps(state_payload, indent=2), encoding="utf-8")
+        state_path.write_text(dumps(state_payload), encoding="utf-8")
 
-    print(json.dumps(bundle, indent=2))
+    print(dumps(bundle))
     return 0
 
 
@@ -12,50 +12,107 @@ It is intentionally optional and does not enforce execution workflows.
 from __future__ import annotations
 
 import argparse
-import shutil
+import os
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-from jsonschema import ValidationError, validate
+try:
+    from agents.tools._yaml_cache import StatCache
+except ImportError:
+    from _yaml_cache import StatCache  # type: ignore
 
+# yaml, jsonschema and shutil are imported where needed: `list` touches none of them,
+# and only `validate` pays for jsonschema.
 
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_ACTIVE_DIR = ROOT / "agents" / "logic" / "agent_outputs" / "plans" / "plan_active"
 DEFAULT_ARCHIVE_DIR = ROOT / "agents" / "logic" / "agent_outputs" / "plans" / "archive"
 DEFAULT_SCHEMA = ROOT / "agents" / "logic" / "agent_protocol" / "schemas" / "plan_doc.schema.yaml"
 
-ALLOWED_PLAN_STATUS = {
+ALLOWED_PLAN_STATUS = frozenset({
     "draft",
     "in_review",
     "approved",
     "in_progress",
     "completed",
     "archived",
-}
-ALLOWED_STEP_STATUS = {"pending", "in_progress", "completed", "blocked", "dropped"}
+})
+ALLOWED_STEP_STATUS = frozenset({"pending", "in_progress", "completed", "blocked", "dropped"})
+_PLAN_STATUS_CHOICES = tuple(sorted(ALLOWED_PLAN_STATUS))
+_STEP_STATUS_CHOICES = tuple(sorted(ALLOWED_STEP_STATUS))
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+@lru_cache(maxsize=1)
+def _yaml_codec() -> tuple[Any, Any, Any]:
+    """Return (yaml, loader, dumper), preferring the libyaml-backed CSafeLoader/CSafeDumper."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _parse_yaml(path: Path) -> Any:
+    yaml, loader, _ = _yaml_codec()
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=loader) or {}
+
+
+# Parsed plan/schema YAML; write_yaml drops the entry it overwrites in case the
+# filesystem mtime is too coarse to notice.
+_yaml_cache = StatCache("plan_doc", _parse_yaml)
+
+
 def read_yaml(path: Path) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         raise SystemExit(f"File not found: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    # A fresh copy each time: commands edit the returned plan in place before writing it back.
+    data = _yaml_cache.load(path, st)
     if not isinstance(data, dict):
         raise SystemExit(f"YAML root must be an object: {path}")
     return data
 
 
+def _replace_file(path: Path, data: bytes) -> None:
+    # Write a sibling temp file and swap it in, so a crash never leaves a half-written plan.
+    _yaml_cache.discard(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 def write_yaml(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.safe_dump(payload, sort_keys=False, allow_unicode=False),
-        encoding="utf-8",
-    )
+    yaml, _, dumper = _yaml_codec()
+    _replace_file(path, yaml.dump(payload, Dumper=dumper, sort_keys=False, allow_unicode=False, encoding="utf-8"))
+
+
+_TOP_LEVEL_STATUS_RE = re.compile(rb"^status:[ \t]*[A-Za-z_]+[ \t]*$", re.MULTILINE)
+
+
+def patch_plan_status(path: Path, status: str) -> bool:
+    """Rewrite the plan's top-level `status:` line in place without a YAML round-trip.
+
+    Only applies when exactly one plain `status: <word>` line sits at column 0;
+    returns False otherwise so the caller can fall back to read_yaml/write_yaml.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return False
+    matches = _TOP_LEVEL_STATUS_RE.findall(data)
+    if len(matches) != 1:
+        return False
+    _replace_file(path, _TOP_LEVEL_STATUS_RE.sub(b"status: " + status.encode("ascii"), data, count=1))
+    return True
 
 
 def resolve_plan_path(path_arg: str | None, plan_id: str | None = None) -> Path:
@@ -97,23 +154,30 @@ def cmd_init(args: argparse.Namespace) -> int:
     return 0
 
 
-def find_step(payload: dict[str, Any], step_id: str) -> dict[str, Any]:
+def index_steps(payload: dict[str, Any]) -> dict[Any, dict[str, Any]]:
+    """Map step id -> step dict (first occurrence wins); steps are shared, not copied."""
     steps = payload.get("steps")
     if not isinstance(steps, list):
         raise SystemExit("Invalid plan: steps must be a list.")
+    index: dict[Any, dict[str, Any]] = {}
     for step in steps:
-        if isinstance(step, dict) and step.get("id") == step_id:
-            return step
-    raise SystemExit(f"Step not found: {step_id}")
+        if isinstance(step, dict) and "id" in step:
+            index.setdefault(step["id"], step)
+    return index
+
+
+def find_step(payload: dict[str, Any], step_id: str) -> dict[str, Any]:
+    step = index_steps(payload).get(step_id)
+    if step is None:
+        raise SystemExit(f"Step not found: {step_id}")
+    return step
 
 
 def cmd_add_step(args: argparse.Namespace) -> int:
     path = resolve_plan_path(args.file)
     payload = read_yaml(path)
     steps = payload.setdefault("steps", [])
-    if not isinstance(steps, list):
-        raise SystemExit("Invalid plan: steps must be a list.")
-    if any(isinstance(s, dict) and s.get("id") == args.step_id for s in steps):
+    if args.step_id in index_steps(payload):
         raise SystemExit(f"Step already exists: {args.step_id}")
     step = {
         "id": args.step_id,
@@ -144,9 +208,10 @@ def cmd_update_step(args: argparse.Namespace) -> int:
 
 def cmd_set_status(args: argparse.Namespace) -> int:
     path = resolve_plan_path(args.file)
-    payload = read_yaml(path)
-    payload["status"] = args.status
-    write_yaml(path, payload)
+    if not patch_plan_status(path, args.status):
+        payload = read_yaml(path)
+        payload["status"] = args.status
+        write_yaml(path, payload)
     print(f"Set plan status to '{args.status}' in {path}")
     return 0
 
@@ -185,21 +250,40 @@ def cmd_handoff(args: argparse.Namespace) -> int:
     return 0
 
 
+@lru_cache(maxsize=8)
+def _get_validator(schema_path: str, mtime_ns: int) -> Any:
+    from jsonschema import validators
+
+    # mtime_ns is part of the cache key so an edited schema is recompiled.
+    schema = read_yaml(Path(schema_path))
+    validator_cls = validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def cmd_validate(args: argparse.Namespace) -> int:
+    from jsonschema.exceptions import best_match
+
     path = resolve_plan_path(args.file)
     payload = read_yaml(path)
     schema_path = Path(args.schema)
     schema_path = schema_path if schema_path.is_absolute() else ROOT / schema_path
-    schema = read_yaml(schema_path)
     try:
-        validate(instance=payload, schema=schema)
-    except ValidationError as exc:
-        raise SystemExit(f"Validation failed for {path}: {exc.message}") from exc
+        mtime_ns = schema_path.stat().st_mtime_ns
+    except OSError:
+        raise SystemExit(f"File not found: {schema_path}")
+    validator = _get_validator(str(schema_path), mtime_ns)
+    # best_match picks the same error jsonschema.validate() would raise.
+    error = best_match(validator.iter_errors(payload))
+    if error is not None:
+        raise SystemExit(f"Validation failed for {path}: {error.message}")
     print(f"Validation passed: {path}")
     return 0
 
 
 def cmd_archive(args: argparse.Namespace) -> int:
+    import shutil
+
     source = resolve_plan_path(args.file)
     if not source.exists():
         raise SystemExit(f"Plan not found: {source}")
@@ -226,7 +310,9 @@ def cmd_list(args: argparse.Namespace) -> int:
     return 0
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    # Built once per process; in-process dispatchers reuse it instead of re-adding every subparser.
     parser = argparse.ArgumentParser(description="Optional Tinker plan document utility.")
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -239,7 +325,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_init.add_argument(
         "--status",
         default="draft",
-        choices=sorted(ALLOWED_PLAN_STATUS),
+        choices=_PLAN_STATUS_CHOICES,
         help="Initial plan status.",
     )
     p_init.add_argument("--constraint", action="append", help="Constraint. Repeat as needed.")
@@ -252,7 +338,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_add.add_argument("--file", required=True, help="Plan file path.")
     p_add.add_argument("--step-id", required=True)
     p_add.add_argument("--description", required=True)
-    p_add.add_argument("--status", default="pending", choices=sorted(ALLOWED_STEP_STATUS))
+    p_add.add_argument("--status", default="pending", choices=_STEP_STATUS_CHOICES)
     p_add.add_argument("--acceptance", action="append", help="Acceptance criteria. Repeat as needed.")
     p_add.set_defaults(func=cmd_add_step)
 
@@ -260,7 +346,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_update.add_argument("--file", required=True, help="Plan file path.")
     p_update.add_argument("--step-id", required=True)
     p_update.add_argument("--description")
-    p_update.add_argument("--status", choices=sorted(ALLOWED_STEP_STATUS))
+    p_update.add_argument("--status", choices=_STEP_STATUS_CHOICES)
     p_update.add_argument(
         "--acceptance",
         action="append",
@@ -270,7 +356,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_status = sub.add_parser("set-status", help="Set plan status.")
     p_status.add_argument("--file", required=True, help="Plan file path.")
-    p_status.add_argument("--status", required=True, choices=sorted(ALLOWED_PLAN_STATUS))
+    p_status.add_argument("--status", required=True, choices=_PLAN_STATUS_CHOICES)
     p_status.set_defaults(func=cmd_set_status)
 
     p_approve = sub.add_parser("approve", help="Record approval and mark plan as approved.")
@@ -9,6 +9,7 @@ No inference is performed; required fields must be provided explicitly.
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -17,6 +18,10 @@ try:
 except Exception as exc:  # pragma: no cover
     raise SystemExit(f"PyYAML required: {exc}")
 
+# libyaml-backed loader/dumper when PyYAML was built with it; same safe semantics either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
@@ -29,7 +34,7 @@ def read_text(path: Path) -> str:
 def load_yaml_file(path: Path) -> dict:
     if not path.exists():
         raise SystemExit(f"Input file not found: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
     return data if isinstance(data, dict) else {}
 
 
@@ -85,12 +90,14 @@ def validate_inputs(
 def validate_payload(payload: dict) -> None:
     mode = str(payload.get("mode", "")).strip()
     objective = str(payload.get("objective", "")).strip()
-    files = payload.get("files") if isinstance(payload.get("files"), list) else []
+    files = payload.get("files")
+    if not isinstance(files, list):
+        files = []
     constraints = str(payload.get("constraints", "")).strip()
     phase = str(payload.get("phase", "")).strip()
-    validation = (
-        payload.get("validation") if isinstance(payload.get("validation"), dict) else {}
-    )
+    validation = payload.get("validation")
+    if not isinstance(validation, dict):
+        validation = {}
     status = str(validation.get("status", "")).strip()
     validated_by = validation.get("validated_by")
     validated_at = validation.get("validated_at")
@@ -112,7 +119,15 @@ def multiline_str_representer(dumper, data: str):
     return dumper.represent_scalar("tag:yaml.org,2002:str", data, style=style)
 
 
-def main() -> int:
+class _TaskDumper(_YAML_DUMPER):  # type: ignore[misc, valid-type]
+    """Private dumper so the block-style str representer does not leak into other yaml users."""
+
+
+_TaskDumper.add_representer(str, multiline_str_representer)
+
+
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Build agents/logic/user_task.yaml from explicit inputs"
     )
@@ -153,7 +168,11 @@ def main() -> int:
         action="store_true",
         help="Allow overwriting an existing file",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
 
     if args.input and args.from_template:
         raise SystemExit("Use only one of --input or --from-template.")
@@ -208,49 +227,28 @@ def main() -> int:
         config_sources = parse_config_sources(args.config_source)
 
         if args.from_template:
-            template = load_yaml_file(resolve_path(args.from_template))
-            if not template:
+            payload = load_yaml_file(resolve_path(args.from_template))
+            if not payload:
                 raise SystemExit("Template must be a valid YAML mapping.")
-            payload = template
-            payload.update({"mode": args.mode, "objective": objective, "files": args.files, "constraints": constraints})
-            if config_sources:
-                payload["config"] = {"sources": config_sources}
-            if args.risk_tolerance:
-                payload["risk_tolerance"] = args.risk_tolerance
-            if args.phase:
-                payload["phase"] = args.phase
-            if any([args.validation_status, args.validated_by, args.validated_at, args.validation_notes, args.phase]):
-                payload["validation"] = {
-                    "status": args.validation_status or "PENDING",
-                    "validated_by": args.validated_by,
-                    "validated_at": args.validated_at,
-                    "notes": args.validation_notes or "Pending validation.",
-                }
-            if args.mode_profile:
-                payload["mode_profile"] = args.mode_profile
         else:
-            payload = {
-                "mode": args.mode,
-                "objective": objective,
-                "files": args.files,
-                "constraints": constraints,
+            payload = {}
+
+        # Template keys keep their position; new keys are appended in a fixed order.
+        payload.update({"mode": args.mode, "objective": objective, "files": args.files, "constraints": constraints})
+        if config_sources:
+            payload["config"] = {"sources": config_sources}
+        payload.update(
+            {key: value for key, value in (("risk_tolerance", args.risk_tolerance), ("phase", args.phase)) if value}
+        )
+        if any([args.validation_status, args.validated_by, args.validated_at, args.validation_notes, args.phase]):
+            payload["validation"] = {
+                "status": args.validation_status or "PENDING",
+                "validated_by": args.validated_by,
+                "validated_at": args.validated_at,
+                "notes": args.validation_notes or "Pending validation.",
             }
-            if config_sources:
-                payload["config"] = {"sources": config_sources}
-            if args.risk_tolerance:
-                payload["risk_tolerance"] = args.risk_tolerance
-            if args.phase:
-                payload["phase"] = args.phase
-            if any([args.validation_status, args.validated_by, args.validated_at, args.validation_notes, args.phase]):
-                payload["validation"] = {
-                    "status": args.validation_status or "PENDING",
-                    "validated_by": args.validated_by,
-                    "validated_at": args.validated_at,
-                    "notes": args.validation_notes or "Pending validation.",
-                }
-
-            if args.mode_profile:
-                payload["mode_profile"] = args.mode_profile
+        if args.mode_profile:
+            payload["mode_profile"] = args.mode_profile
 
         validate_payload(payload)
 
@@ -259,8 +257,7 @@ def main() -> int:
         raise SystemExit("Output file exists. Use --overwrite to replace it.")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    yaml.SafeDumper.add_representer(str, multiline_str_representer)
-    out_path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+    out_path.write_text(yaml.dump(payload, Dumper=_TaskDumper, sort_keys=False), encoding="utf-8")
     print(f"Wrote: {out_path}")
     return 0
 
@@ -6,20 +6,40 @@ Shared helpers for file_exploration canonical wrappers.
 from __future__ import annotations
 
 from datetime import date, datetime, time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 import math
+import os
+import stat as stat_mod
 
 
+@lru_cache(maxsize=1)
 def project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+def is_within(path: Path, root: Path) -> bool:
+    """String-prefix containment for already-resolved paths; same answer as relative_to() without the path math."""
+    # normcase keeps the Windows comparison case-insensitive, as relative_to() is there.
+    path_str = os.path.normcase(os.fspath(path))
+    root_str = os.path.normcase(os.fspath(root))
+    return path_str == root_str or path_str.startswith(root_str.rstrip(os.sep) + os.sep)
+
+
+def stat_once(path: Path) -> os.stat_result | None:
+    """A single stat call standing in for exists()/is_file()/is_dir(); None when the path is missing."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 def resolve_repo_path(
     raw_path: Any,
     *,
     field_name: str = "path",
-    allowed_suffixes: set[str] | None = None,
+    allowed_suffixes: frozenset[str] | set[str] | None = None,
     must_exist: bool = True,
     file_only: bool = True,
 ) -> tuple[str, Path]:
@@ -32,19 +52,18 @@ def resolve_repo_path(
         candidate = root / candidate
     resolved = candidate.resolve()
 
-    try:
-        resolved.relative_to(root)
-    except ValueError as exc:
-        raise ValueError(f"{field_name} must resolve inside project root: {resolved}") from exc
+    if not is_within(resolved, root):
+        raise ValueError(f"{field_name} must resolve inside project root: {resolved}")
 
     if allowed_suffixes is not None and resolved.suffix.lower() not in allowed_suffixes:
         allowed = ", ".join(sorted(allowed_suffixes))
         raise ValueError(f"{field_name} must use one of extensions: {allowed}")
 
-    if must_exist and not resolved.exists():
+    st = stat_once(resolved)
+    if must_exist and st is None:
         raise FileNotFoundError(f"{field_name} not found: {resolved}")
 
-    if file_only and resolved.exists() and not resolved.is_file():
+    if file_only and st is not None and not stat_mod.S_ISREG(st.st_mode):
         raise ValueError(f"{field_name} must be a file: {resolved}")
 
     return str(resolved), resolved
@@ -112,9 +131,11 @@ def to_jsonable(value: Any) -> Any:
     return str(value)
 
 
-def file_stats(path: Path) -> dict[str, Any]:
-    stat = path.stat()
-    return {"size_bytes": stat.st_size}
+def file_stats(path: Path, st: os.stat_result | None = None) -> dict[str, Any]:
+    """Size metadata for `path`; pass `st` when the caller already has a stat result."""
+    if st is None:
+        st = path.stat()
+    return {"size_bytes": st.st_size}
 
 
 def preview_text(raw: str, *, max_chars: int) -> tuple[str, bool]:
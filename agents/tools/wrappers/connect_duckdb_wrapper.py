@@ -5,12 +5,14 @@ Canonical execution wrapper for the `connect_duckdb` skill.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import duckdb
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     # .../agents/tools/wrappers/connect_duckdb_wrapper.py -> project root
     return Path(__file__).resolve().parents[2]
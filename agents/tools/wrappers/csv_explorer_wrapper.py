@@ -6,6 +6,8 @@ Canonical execution wrapper for the `csv_explorer` skill.
 from __future__ import annotations
 
 import csv
+import os
+from itertools import islice, zip_longest
 from pathlib import Path
 from typing import Any
 
@@ -20,19 +22,32 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".csv"})
+
+
 def _normalize_headers(header_row: list[str]) -> list[str]:
     seen: dict[str, int] = {}
+    seen_get = seen.get
     normalized: list[str] = []
-    for idx, raw in enumerate(header_row):
+    append = normalized.append
+    for idx, raw in enumerate(header_row, 1):
         base = raw.strip() if isinstance(raw, str) else ""
         if not base:
-            base = f"column_{idx + 1}"
-        count = seen.get(base, 0)
-        seen[base] = count + 1
-        normalized.append(base if count == 0 else f"{base}_{count + 1}")
+            base = f"column_{idx}"
+        count = seen_get(base, 0) + 1
+        seen[base] = count
+        append(base if count == 1 else f"{base}_{count}")
     return normalized
 
 
+def _parse_char(value: Any, *, field: str) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, str) and len(value) == 1:
+        return value
+    raise ValueError(f"{field} must be a single character when provided.")
+
+
 def run(args: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(args, dict):
         raise ValueError("Wrapper args must be a JSON object.")
@@ -40,26 +55,38 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".csv"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     encoding = parse_encoding(args.get("encoding"), default="utf-8-sig")
     preview_rows = parse_int(args.get("preview_rows"), field="preview_rows", default=5, minimum=0, maximum=200)
+    delimiter_arg = _parse_char(args.get("delimiter"), field="delimiter")
+    quotechar_arg = _parse_char(args.get("quotechar"), field="quotechar")
 
     with resolved.open("r", encoding=encoding, newline="") as handle:
-        sample = handle.read(4096)
-        handle.seek(0)
-        try:
-            dialect = csv.Sniffer().sniff(sample)
-            delimiter = dialect.delimiter
-            quotechar = dialect.quotechar
-        except csv.Error:
-            delimiter = ","
-            quotechar = '"'
+        st = os.fstat(handle.fileno())
+        if delimiter_arg is not None and quotechar_arg is not None:
+            # Both given explicitly: nothing left for the Sniffer to infer.
+            delimiter, quotechar = delimiter_arg, quotechar_arg
+        else:
+            sample = handle.read(4096)
+            handle.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample)
+                delimiter = dialect.delimiter
+                quotechar = dialect.quotechar
+            except csv.Error:
+                delimiter = ","
+                quotechar = '"'
+            delimiter = delimiter_arg or delimiter
+            quotechar = quotechar_arg or quotechar
 
         reader = csv.reader(handle, delimiter=delimiter, quotechar=quotechar)
-        all_rows = list(reader)
+        # Single pass: keep the header and preview rows, only count the rest.
+        header_row = next(reader, None)
+        preview_raw = list(islice(reader, preview_rows))
+        row_count = len(preview_raw) + sum(1 for _ in reader)
 
-    if not all_rows:
+    if header_row is None:
         return {
             "status": "ok",
             "skill": "csv_explorer",
@@ -72,16 +99,16 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
             "column_count": 0,
             "columns": [],
             "rows_preview": [],
-            **file_stats(resolved),
+            **file_stats(resolved, st),
         }
 
-    headers = _normalize_headers([str(v) for v in all_rows[0]])
-    data_rows = all_rows[1:]
+    headers = _normalize_headers([str(v) for v in header_row])
 
     preview: list[dict[str, Any]] = []
-    for row in data_rows[:preview_rows]:
-        padded = row + [None] * max(0, len(headers) - len(row))
-        preview.append({headers[idx]: padded[idx] for idx in range(len(headers))})
+    width = len(headers)
+    for row in preview_raw:
+        # Short rows are padded with None; islice drops cells beyond the header width.
+        preview.append(dict(islice(zip_longest(headers, row), width)))
 
     return {
         "status": "ok",
@@ -91,11 +118,11 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         "encoding": encoding,
         "delimiter": delimiter,
         "quotechar": quotechar,
-        "row_count": len(data_rows),
+        "row_count": row_count,
         "column_count": len(headers),
         "columns": headers,
         "rows_preview": preview,
-        **file_stats(resolved),
+        **file_stats(resolved, st),
     }
 
 
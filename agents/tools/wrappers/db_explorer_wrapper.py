@@ -20,7 +20,7 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_bool, parse_int, resolve_repo_path, to_jsonable
 
 
-SUPPORTED_SUFFIXES = {".duckdb", ".db", ".sqlite", ".sqlite3"}
+SUPPORTED_SUFFIXES = frozenset({".duckdb", ".db", ".sqlite", ".sqlite3"})
 
 
 def _table_name(value: Any) -> str | None:
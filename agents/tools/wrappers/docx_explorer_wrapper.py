@@ -5,17 +5,29 @@ Canonical execution wrapper for the `docx_explorer` skill.
 
 from __future__ import annotations
 
-from pathlib import PurePosixPath
 from typing import Any
-from xml.etree import ElementTree as ET
 import zipfile
 
+try:
+    from lxml import etree as ET  # type: ignore
+
+    # DOCX parts are untrusted input and lxml before 5.x resolves external entities by
+    # default, so pin entity expansion and network access off for every parse.
+    _LXML_HARDENING: dict[str, Any] | None = {"resolve_entities": False, "no_network": True}
+except ImportError:
+    from xml.etree import ElementTree as ET  # type: ignore
+
+    _LXML_HARDENING = None
+
 try:
     from agents.tools.wrappers._explorer_common import file_stats, parse_int, resolve_repo_path
 except ImportError:
     from wrappers._explorer_common import file_stats, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".docx"})
+
+
 W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
 CP_NS = {
     "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
@@ -23,20 +35,46 @@ CP_NS = {
     "dcterms": "http://purl.org/dc/terms/",
 }
 
+W_P = f"{{{W_NS['w']}}}p"
+W_T = f"{{{W_NS['w']}}}t"
+W_TBL = f"{{{W_NS['w']}}}tbl"
+
+
+# Clark-notation tag -> output key, in the order the fields are reported.
+_CORE_PROP_TAGS = {
+    f"{{{CP_NS[prefix]}}}{tag}": tag
+    for prefix, tags in (("dc", ("title", "subject", "creator")), ("dcterms", ("created", "modified")))
+    for tag in tags
+}
+
+
+def _fromstring(data: bytes) -> Any:
+    if _LXML_HARDENING is None:
+        return ET.fromstring(data)
+    return ET.fromstring(data, ET.XMLParser(**_LXML_HARDENING))
+
+
+def _iterparse(source: Any, events: tuple[str, ...]) -> Any:
+    if _LXML_HARDENING is None:
+        return ET.iterparse(source, events=events)
+    return ET.iterparse(source, events=events, **_LXML_HARDENING)
 
-def _core_props(zf: zipfile.ZipFile) -> dict[str, str]:
-    if "docProps/core.xml" not in zf.namelist():
+
+def _core_props(zf: zipfile.ZipFile, members: set[str]) -> dict[str, str]:
+    if "docProps/core.xml" not in members:
         return {}
-    root = ET.fromstring(zf.read("docProps/core.xml"))
+    root = _fromstring(zf.read("docProps/core.xml"))
+    # One pass over the direct children; like find(), only the first element of each kind counts.
+    first: dict[str, Any] = {}
+    for elem in root:
+        key = _CORE_PROP_TAGS.get(elem.tag)
+        if key is not None and key not in first:
+            first[key] = elem
     out: dict[str, str] = {}
-    for tag in ["title", "subject", "creator"]:
-        node = root.find(f"dc:{tag}", CP_NS)
-        if node is not None and node.text:
-            out[tag] = node.text.strip()
-    for tag in ["created", "modified"]:
-        node = root.find(f"dcterms:{tag}", CP_NS)
+    for key in _CORE_PROP_TAGS.values():
+        node = first.get(key)
         if node is not None and node.text:
-            out[tag] = node.text.strip()
+            out[key] = node.text.strip()
     return out
 
 
@@ -47,7 +85,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".docx"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     preview_paragraphs = parse_int(
         args.get("preview_paragraphs"),
@@ -59,32 +97,60 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
 
     with zipfile.ZipFile(resolved) as zf:
         members = zf.namelist()
-        if "word/document.xml" not in members:
+        member_set = set(members)
+        if "word/document.xml" not in member_set:
             raise ValueError("Invalid DOCX file: missing word/document.xml.")
-        root = ET.fromstring(zf.read("word/document.xml"))
-        paragraphs = []
-        for paragraph in root.findall(".//w:p", W_NS):
-            texts = [node.text for node in paragraph.findall(".//w:t", W_NS) if node.text]
-            joined = "".join(texts).strip()
-            if joined:
-                paragraphs.append(joined)
-
-        table_count = len(root.findall(".//w:tbl", W_NS))
-        header_parts = len([name for name in members if PurePosixPath(name).name.startswith("header")])
-        footer_parts = len([name for name in members if PurePosixPath(name).name.startswith("footer")])
-
-        metadata = _core_props(zf)
+        paragraph_count = 0
+        table_count = 0
+        preview: list[str | None] = [None] * preview_paragraphs
+        # Stream the body instead of building the whole tree; document.xml can be tens of MB.
+        # Paragraphs can nest (text boxes), so each open one remembers how many non-empty
+        # paragraphs had closed before it started; only outermost ones are cleared.
+        open_paragraphs: list[int] = []
+        with zf.open("word/document.xml") as fp:
+            for event, elem in _iterparse(fp, ("start", "end")):
+                if event == "start":
+                    if elem.tag == W_P:
+                        open_paragraphs.append(paragraph_count)
+                    elif elem.tag == W_TBL:
+                        table_count += 1
+                    continue
+                if elem.tag != W_P:
+                    continue
+                preceding = open_paragraphs.pop()
+                if any(node.text and not node.text.isspace() for node in elem.iter(W_T)):
+                    paragraph_count += 1
+                    # Enclosing paragraphs contain this text too, so they rank ahead of it.
+                    rank = preceding + len(open_paragraphs)
+                    if rank < preview_paragraphs:
+                        preview[rank] = "".join(node.text for node in elem.iter(W_T) if node.text).strip()
+                if not open_paragraphs:
+                    elem.clear()
+                    # lxml keeps cleared siblings attached to the parent; drop them as well.
+                    if hasattr(elem, "getprevious"):
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+
+        header_parts = footer_parts = 0
+        for name in members:
+            base = name.rstrip("/").rpartition("/")[2]
+            if base.startswith("header"):
+                header_parts += 1
+            elif base.startswith("footer"):
+                footer_parts += 1
+
+        metadata = _core_props(zf, member_set)
 
     return {
         "status": "ok",
         "skill": "docx_explorer",
         "path": args.get("path"),
         "resolved_path": resolved_str,
-        "paragraph_count": len(paragraphs),
+        "paragraph_count": paragraph_count,
         "table_count": table_count,
         "header_part_count": header_parts,
         "footer_part_count": footer_parts,
-        "paragraphs_preview": paragraphs[:preview_paragraphs],
+        "paragraphs_preview": [text for text in preview if text is not None],
         "metadata": metadata,
         **file_stats(resolved),
     }
@@ -5,8 +5,15 @@ Canonical execution wrapper for the `excel_explorer` skill.
 
 from __future__ import annotations
 
+from datetime import date, datetime, time
+from itertools import islice
 from typing import Any
 
+try:
+    from python_calamine import CalamineWorkbook  # type: ignore
+except ImportError:
+    CalamineWorkbook = None  # type: ignore
+
 try:
     from agents.tools.wrappers._explorer_common import (
         file_stats,
@@ -19,6 +26,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_bool, parse_int, resolve_repo_path, to_jsonable
 
 
+SUPPORTED_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xltx", ".xltm"})
+
+
 def _sheet_name(value: Any) -> str | int | None:
     if value is None:
         return None
@@ -32,20 +42,67 @@ def _sheet_name(value: Any) -> str | int | None:
     raise ValueError("sheet_name must be a non-empty string or integer when provided.")
 
 
-def run(args: dict[str, Any]) -> dict[str, Any]:
-    if not isinstance(args, dict):
-        raise ValueError("Wrapper args must be a JSON object.")
+def _pick_sheet(sheet_names: list[str], selected: str | int | None) -> int:
+    if selected is None:
+        return 0
+    if isinstance(selected, int):
+        if selected < 0 or selected >= len(sheet_names):
+            raise ValueError(f"sheet_name index out of range: {selected}")
+        return selected
+    if selected not in sheet_names:
+        raise ValueError(f"sheet_name not found: {selected}")
+    return sheet_names.index(selected)
 
-    resolved_str, resolved = resolve_repo_path(
-        args.get("path"),
-        field_name="path",
-        allowed_suffixes={".xlsx", ".xlsm", ".xltx", ".xltm"},
-    )
-    data_only = parse_bool(args.get("data_only"), field="data_only", default=True)
-    read_only = parse_bool(args.get("read_only"), field="read_only", default=True)
-    preview_rows = parse_int(args.get("preview_rows"), field="preview_rows", default=5, minimum=0, maximum=100)
-    selected = _sheet_name(args.get("sheet_name"))
 
+def _calamine_value(value: Any) -> Any:
+    # Normalize to what openpyxl reports: None for blanks, ints for integral numbers, datetimes for dates.
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime.combine(value, time())
+    return value
+
+
+def _read_with_calamine(
+    resolved: Any,
+    selected: str | int | None,
+    preview_rows: int,
+) -> tuple[list[dict[str, Any]], str, list[tuple[Any, ...]]]:
+    workbook = CalamineWorkbook.from_path(str(resolved))
+    try:
+        sheet_names = list(workbook.sheet_names)
+        index = _pick_sheet(sheet_names, selected)
+        sheet_summaries: list[dict[str, Any]] = []
+        rows: list[tuple[Any, ...]] = []
+        # Each sheet is parsed once for its used range; only the selected one is turned into rows,
+        # and no other sheet's cells are kept alive past its summary.
+        for position, name in enumerate(sheet_names):
+            sheet = workbook.get_sheet_by_name(name)
+            end = sheet.end
+            sheet_summaries.append(
+                {
+                    "name": name,
+                    "max_row": end[0] + 1 if end is not None else 1,
+                    "max_column": end[1] + 1 if end is not None else 1,
+                }
+            )
+            if position == index:
+                raw_rows = sheet.to_python(skip_empty_area=False, nrows=preview_rows + 1)
+                rows = [tuple(_calamine_value(value) for value in row) for row in raw_rows]
+    finally:
+        workbook.close()
+    return sheet_summaries, sheet_names[index], rows
+
+
+def _read_with_openpyxl(
+    resolved: Any,
+    selected: str | int | None,
+    preview_rows: int,
+    read_only: bool,
+    data_only: bool,
+) -> tuple[list[dict[str, Any]], str, list[tuple[Any, ...]]]:
     try:
         import openpyxl
     except ImportError as exc:
@@ -53,6 +110,8 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
 
     workbook = openpyxl.load_workbook(resolved, read_only=read_only, data_only=data_only)
     try:
+        worksheet = workbook.worksheets[_pick_sheet(workbook.sheetnames, selected)]
+        # In read-only mode max_row/max_column come from each sheet's <dimension> tag, not a cell scan.
         sheet_summaries: list[dict[str, Any]] = []
         for ws in workbook.worksheets:
             sheet_summaries.append(
@@ -63,32 +122,43 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
                 }
             )
 
-        if selected is None:
-            worksheet = workbook.worksheets[0]
-        elif isinstance(selected, int):
-            if selected < 0 or selected >= len(workbook.worksheets):
-                raise ValueError(f"sheet_name index out of range: {selected}")
-            worksheet = workbook.worksheets[selected]
-        else:
-            if selected not in workbook.sheetnames:
-                raise ValueError(f"sheet_name not found: {selected}")
-            worksheet = workbook[selected]
-
-        row_iter = worksheet.iter_rows(values_only=True)
-        header_raw = next(row_iter, None)
-        headers: list[str] = []
-        if header_raw is not None:
-            headers = [str(v).strip() if v is not None else f"column_{idx + 1}" for idx, v in enumerate(header_raw)]
-
-        preview: list[dict[str, Any]] = []
-        for row in row_iter:
-            if len(preview) >= preview_rows:
-                break
-            row_values = list(row)
-            row_values += [None] * max(0, len(headers) - len(row_values))
-            preview.append({headers[idx]: to_jsonable(row_values[idx]) for idx in range(len(headers))})
+        rows = list(islice(worksheet.iter_rows(values_only=True), preview_rows + 1))
     finally:
         workbook.close()
+    return sheet_summaries, worksheet.title, rows
+
+
+def run(args: dict[str, Any]) -> dict[str, Any]:
+    if not isinstance(args, dict):
+        raise ValueError("Wrapper args must be a JSON object.")
+
+    resolved_str, resolved = resolve_repo_path(
+        args.get("path"),
+        field_name="path",
+        allowed_suffixes=SUPPORTED_SUFFIXES,
+    )
+    data_only = parse_bool(args.get("data_only"), field="data_only", default=True)
+    read_only = parse_bool(args.get("read_only"), field="read_only", default=True)
+    preview_rows = parse_int(args.get("preview_rows"), field="preview_rows", default=5, minimum=0, maximum=100)
+    selected = _sheet_name(args.get("sheet_name"))
+
+    # calamine only yields cached values, so formula text (data_only=False) still needs openpyxl.
+    if CalamineWorkbook is not None and data_only:
+        sheet_summaries, selected_title, rows = _read_with_calamine(resolved, selected, preview_rows)
+    else:
+        sheet_summaries, selected_title, rows = _read_with_openpyxl(
+            resolved, selected, preview_rows, read_only, data_only
+        )
+
+    headers: list[str] = []
+    if rows:
+        headers = [str(v).strip() if v is not None else f"column_{idx + 1}" for idx, v in enumerate(rows[0])]
+
+    preview: list[dict[str, Any]] = []
+    for row in rows[1:]:
+        row_values = list(row)
+        row_values += [None] * max(0, len(headers) - len(row_values))
+        preview.append({headers[idx]: to_jsonable(row_values[idx]) for idx in range(len(headers))})
 
     return {
         "status": "ok",
@@ -99,11 +169,9 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         "data_only": data_only,
         "sheet_count": len(sheet_summaries),
         "sheet_summaries": sheet_summaries,
-        "selected_sheet": worksheet.title,
+        "selected_sheet": selected_title,
         "columns": headers,
         "column_count": len(headers),
         "rows_preview": preview,
         **file_stats(resolved),
     }
-
-
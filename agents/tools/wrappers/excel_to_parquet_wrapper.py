@@ -5,10 +5,12 @@ Canonical execution wrapper for the `excel_to_parquet` skill.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -5,39 +5,18 @@ Canonical execution wrapper for the `file_explorer` facade skill.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+import codecs
+import importlib
+import os
 
 try:
     from agents.tools.wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
-    from agents.tools.wrappers.csv_explorer_wrapper import run as run_csv_explorer
-    from agents.tools.wrappers.db_explorer_wrapper import run as run_db_explorer
-    from agents.tools.wrappers.docx_explorer_wrapper import run as run_docx_explorer
-    from agents.tools.wrappers.excel_explorer_wrapper import run as run_excel_explorer
-    from agents.tools.wrappers.html_explorer_wrapper import run as run_html_explorer
-    from agents.tools.wrappers.json_explorer_wrapper import run as run_json_explorer
-    from agents.tools.wrappers.markdown_explorer_wrapper import run as run_markdown_explorer
-    from agents.tools.wrappers.parquet_explorer_wrapper import run as run_parquet_explorer
-    from agents.tools.wrappers.pdf_explorer_wrapper import run as run_pdf_explorer
-    from agents.tools.wrappers.powerbi_explorer_wrapper import run as run_powerbi_explorer
-    from agents.tools.wrappers.pptx_explorer_wrapper import run as run_pptx_explorer
-    from agents.tools.wrappers.xml_explorer_wrapper import run as run_xml_explorer
-    from agents.tools.wrappers.yaml_explorer_wrapper import run as run_yaml_explorer
 except ImportError:
     from wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
-    from wrappers.csv_explorer_wrapper import run as run_csv_explorer
-    from wrappers.db_explorer_wrapper import run as run_db_explorer
-    from wrappers.docx_explorer_wrapper import run as run_docx_explorer
-    from wrappers.excel_explorer_wrapper import run as run_excel_explorer
-    from wrappers.html_explorer_wrapper import run as run_html_explorer
-    from wrappers.json_explorer_wrapper import run as run_json_explorer
-    from wrappers.markdown_explorer_wrapper import run as run_markdown_explorer
-    from wrappers.parquet_explorer_wrapper import run as run_parquet_explorer
-    from wrappers.pdf_explorer_wrapper import run as run_pdf_explorer
-    from wrappers.powerbi_explorer_wrapper import run as run_powerbi_explorer
-    from wrappers.pptx_explorer_wrapper import run as run_pptx_explorer
-    from wrappers.xml_explorer_wrapper import run as run_xml_explorer
-    from wrappers.yaml_explorer_wrapper import run as run_yaml_explorer
 
 
 WrapperFunc = Callable[[dict[str, Any]], dict[str, Any]]
@@ -68,45 +47,152 @@ ROUTING_BY_SUFFIX: dict[str, str] = {
     ".yml": "yaml_explorer",
 }
 
-WRAPPER_BY_SKILL: dict[str, WrapperFunc] = {
-    "csv_explorer": run_csv_explorer,
-    "db_explorer": run_db_explorer,
-    "docx_explorer": run_docx_explorer,
-    "excel_explorer": run_excel_explorer,
-    "html_explorer": run_html_explorer,
-    "json_explorer": run_json_explorer,
-    "markdown_explorer": run_markdown_explorer,
-    "parquet_explorer": run_parquet_explorer,
-    "pdf_explorer": run_pdf_explorer,
-    "powerbi_explorer": run_powerbi_explorer,
-    "pptx_explorer": run_pptx_explorer,
-    "xml_explorer": run_xml_explorer,
-    "yaml_explorer": run_yaml_explorer,
+# Delegate modules are imported on first use so one routed request only loads its own wrapper.
+WRAPPER_MODULE_BY_SKILL: dict[str, str] = {
+    "csv_explorer": "csv_explorer_wrapper",
+    "db_explorer": "db_explorer_wrapper",
+    "docx_explorer": "docx_explorer_wrapper",
+    "excel_explorer": "excel_explorer_wrapper",
+    "html_explorer": "html_explorer_wrapper",
+    "json_explorer": "json_explorer_wrapper",
+    "markdown_explorer": "markdown_explorer_wrapper",
+    "parquet_explorer": "parquet_explorer_wrapper",
+    "pdf_explorer": "pdf_explorer_wrapper",
+    "powerbi_explorer": "powerbi_explorer_wrapper",
+    "pptx_explorer": "pptx_explorer_wrapper",
+    "xml_explorer": "xml_explorer_wrapper",
+    "yaml_explorer": "yaml_explorer_wrapper",
 }
 
 
-def _read_generic_text(path: Path, encoding: str, preview_chars: int) -> dict[str, Any]:
-    raw_bytes = path.read_bytes()
-    if b"\x00" in raw_bytes:
-        return {
-            "generic_type": "binary",
-            "bytes_preview_hex": raw_bytes[: min(preview_chars, 1024)].hex(),
-            "truncated": len(raw_bytes) > min(preview_chars, 1024),
-        }
-    raw = raw_bytes.decode(encoding)
+@lru_cache(maxsize=None)
+def _load_wrapper(skill: str) -> WrapperFunc:
+    module_name = WRAPPER_MODULE_BY_SKILL[skill]
+    try:
+        module = importlib.import_module(f"agents.tools.wrappers.{module_name}")
+    except ImportError:
+        module = importlib.import_module(f"wrappers.{module_name}")
+    return module.run
+
+
+_SNIFF_BYTES = 1 << 16
+_DECODE_CHUNK_BYTES = 1 << 20
+
+
+class _BinaryContent(Exception):
+    """A NUL byte turned up after the sniffed head of the file."""
+
+
+def _binary_preview(head: bytes, size: int, preview_chars: int) -> dict[str, Any]:
+    limit = min(preview_chars, 1024)
+    return {
+        "generic_type": "binary",
+        "bytes_preview_hex": head[:limit].hex(),
+        "truncated": size > limit,
+    }
+
+
+def _iter_chunks(fp: BinaryIO, head: bytes) -> Iterator[bytes]:
+    yield head
+    for chunk in iter(lambda: fp.read(_DECODE_CHUNK_BYTES), b""):
+        if b"\x00" in chunk:
+            raise _BinaryContent
+        yield chunk
+
+
+def _iter_decoded(chunks: Iterator[bytes], encoding: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _summarize_text(texts: Iterable[str], encoding: str, preview_chars: int) -> dict[str, Any]:
+    preview_parts: list[str] = []
+    preview_len = 0
+    char_count = 0
+    newline_count = 0
+    for text in texts:
+        char_count += len(text)
+        newline_count += text.count("\n")
+        if preview_len < preview_chars:
+            preview_parts.append(text[: preview_chars - preview_len])
+            preview_len += len(preview_parts[-1])
     return {
         "generic_type": "text",
         "encoding": encoding,
-        "line_count": raw.count("\n") + 1,
-        "text_preview": raw[:preview_chars],
-        "truncated": len(raw) > preview_chars,
+        "line_count": newline_count + 1,
+        "text_preview": "".join(preview_parts),
+        "truncated": char_count > preview_chars,
+    }
+
+
+def _read_generic(path: Path, encoding: str, preview_chars: int) -> dict[str, Any]:
+    """Classify and summarize a file that no delegate handles, streaming it in chunks.
+
+    A NUL byte anywhere (checked on the sniffed head first) or a decode error makes it binary.
+    """
+    with path.open("rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        head = fp.read(_SNIFF_BYTES)
+        if b"\x00" in head:
+            return _binary_preview(head, size, preview_chars)
+        try:
+            return _summarize_text(_iter_decoded(_iter_chunks(fp, head), encoding), encoding, preview_chars)
+        except (UnicodeDecodeError, _BinaryContent):
+            return _binary_preview(head, size, preview_chars)
+        except UnicodeError:
+            # Incremental UTF-16/32 decoders insist on a BOM; a one-shot decode does not.
+            fp.seek(0)
+            raw_bytes = fp.read()
+    if b"\x00" in raw_bytes:
+        return _binary_preview(head, size, preview_chars)
+    try:
+        return _summarize_text([raw_bytes.decode(encoding)], encoding, preview_chars)
+    except UnicodeDecodeError:
+        return _binary_preview(head, size, preview_chars)
+
+
+def _run_batch_item(args: dict[str, Any]) -> dict[str, Any]:
+    try:
+        return _run_single(args)
+    except Exception as exc:
+        return {"status": "error", "path": args.get("path"), "error": str(exc)}
+
+
+def _run_batch(args: dict[str, Any]) -> dict[str, Any]:
+    paths = args.get("paths")
+    if not isinstance(paths, list) or not paths:
+        raise ValueError("paths must be a non-empty list of strings when provided.")
+    if args.get("path") is not None:
+        raise ValueError("Use only one of path or paths.")
+
+    shared = {key: value for key, value in args.items() if key != "paths"}
+    items = [{**shared, "path": path} for path in paths]
+    # Per-file work is mostly file reads, zip inflation and C parsers, which release the GIL.
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_run_batch_item, items))
+
+    return {
+        "status": "ok",
+        "skill": "file_explorer",
+        "batch": True,
+        "file_count": len(results),
+        "error_count": sum(1 for result in results if result["status"] != "ok"),
+        "results": results,
     }
 
 
 def run(args: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(args, dict):
         raise ValueError("Wrapper args must be a JSON object.")
+    if args.get("paths") is not None:
+        return _run_batch(args)
+    return _run_single(args)
 
+
+def _run_single(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(args.get("path"), field_name="path")
     force_skill = args.get("force_skill")
     if force_skill is not None and (not isinstance(force_skill, str) or not force_skill.strip()):
@@ -123,8 +209,8 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     delegate_args = dict(delegate_args)
     delegate_args.setdefault("path", args.get("path"))
 
-    if delegated_skill in WRAPPER_BY_SKILL:
-        result = WRAPPER_BY_SKILL[delegated_skill](delegate_args)
+    if delegated_skill in WRAPPER_MODULE_BY_SKILL:
+        result = _load_wrapper(delegated_skill)(delegate_args)
         return {
             "status": "ok",
             "skill": "file_explorer",
@@ -138,15 +224,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
 
     encoding = parse_encoding(args.get("encoding"), default="utf-8-sig")
     preview_chars = parse_int(args.get("preview_chars"), field="preview_chars", default=400, minimum=0, maximum=8000)
-    try:
-        generic = _read_generic_text(resolved, encoding=encoding, preview_chars=preview_chars)
-    except UnicodeDecodeError:
-        raw = resolved.read_bytes()
-        generic = {
-            "generic_type": "binary",
-            "bytes_preview_hex": raw[: min(preview_chars, 1024)].hex(),
-            "truncated": len(raw) > min(preview_chars, 1024),
-        }
+    generic = _read_generic(resolved, encoding=encoding, preview_chars=preview_chars)
 
     return {
         "status": "ok",
@@ -6,17 +6,22 @@ Canonical execution wrapper for the `generate_exe_pyinstaller_onedir` skill.
 from __future__ import annotations
 
 import os
+import stat
 import subprocess
 import sys
+import threading
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 try:
-    from agents.tools.wrappers._explorer_common import parse_bool, resolve_repo_path
+    from agents.tools.wrappers._explorer_common import is_within, parse_bool, resolve_repo_path, stat_once
 except ImportError:
-    from wrappers._explorer_common import parse_bool, resolve_repo_path
+    from wrappers._explorer_common import is_within, parse_bool, resolve_repo_path, stat_once
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -31,14 +36,13 @@ def _resolve_repo_dir(raw_path: Any, *, field_name: str, must_exist: bool) -> tu
         candidate = root / candidate
     resolved = candidate.resolve()
 
-    try:
-        resolved.relative_to(root)
-    except ValueError as exc:
-        raise ValueError(f"{field_name} must resolve inside project root: {resolved}") from exc
+    if not is_within(resolved, root):
+        raise ValueError(f"{field_name} must resolve inside project root: {resolved}")
 
-    if must_exist and not resolved.exists():
+    st = stat_once(resolved)
+    if must_exist and st is None:
         raise FileNotFoundError(f"{field_name} not found: {resolved}")
-    if resolved.exists() and not resolved.is_dir():
+    if st is not None and not stat.S_ISDIR(st.st_mode):
         raise ValueError(f"{field_name} must be a directory: {resolved}")
     return str(resolved), resolved
 
@@ -57,11 +61,18 @@ def _parse_string_list(raw: Any, *, field_name: str) -> list[str]:
     return parsed
 
 
-def _tail(text: str, max_lines: int = 40) -> str:
-    lines = text.splitlines()
+def _tail(lines: deque[str], max_lines: int = 40) -> str:
     if len(lines) <= max_lines:
         return "\n".join(lines)
-    return "\n".join(lines[-max_lines:])
+    return "\n".join(list(lines)[-max_lines:])
+
+
+def _drain(stream: IO[str], tail: deque[str], warnings: list[str] | None = None) -> None:
+    for line in stream:
+        line = line.rstrip("\r\n")
+        tail.append(line)
+        if warnings is not None and "WARNING" in line:
+            warnings.append(line.strip())
 
 
 def run(args: dict[str, Any]) -> dict[str, Any]:
@@ -114,11 +125,11 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         venv_python = venv_path / "Scripts" / "python.exe"
     else:
         venv_python = venv_path / "bin" / "python"
-    if not venv_python.exists():
+    if stat_once(venv_python) is None:
         raise ValueError(f"Invalid virtual environment: Python not found at {venv_python}")
 
     pyvenv_cfg = venv_path / "pyvenv.cfg"
-    if not pyvenv_cfg.exists():
+    if stat_once(pyvenv_cfg) is None:
         raise ValueError(f"Invalid virtual environment: pyvenv.cfg not found in {venv_path}")
 
     cmd: list[str] = [
@@ -178,23 +189,30 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     env = os.environ.copy()
     env.setdefault("PYTHONIOENCODING", "utf-8")
 
-    result = subprocess.run(
+    # Build logs can be huge; stream both pipes and keep only the tails and WARNING lines.
+    stdout_lines: deque[str] = deque(maxlen=40)
+    stderr_lines: deque[str] = deque(maxlen=60)
+    warnings: list[str] = []
+    with subprocess.Popen(
         cmd,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
         env=env,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        stderr_tail = _tail(result.stderr, max_lines=60)
+    ) as proc:
+        stdout_reader = threading.Thread(target=_drain, args=(proc.stdout, stdout_lines), daemon=True)
+        stdout_reader.start()
+        _drain(proc.stderr, stderr_lines, warnings)
+        stdout_reader.join()
+        returncode = proc.wait()
+
+    if returncode != 0:
+        stderr_tail = _tail(stderr_lines, max_lines=60)
         raise RuntimeError(
             "PyInstaller build failed with exit code "
-            f"{result.returncode}. stderr tail:\n{stderr_tail}"
+            f"{returncode}. stderr tail:\n{stderr_tail}"
         )
 
-    warnings = [line.strip() for line in result.stderr.splitlines() if "WARNING" in line]
-
     return {
         "status": "ok",
         "skill": "generate_exe_pyinstaller_onedir",
@@ -209,10 +227,10 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         "excludes": excludes,
         "clean": clean,
         "command": cmd,
-        "returncode": result.returncode,
+        "returncode": returncode,
         "build_warnings": warnings,
-        "stdout_tail": _tail(result.stdout),
-        "stderr_tail": _tail(result.stderr),
+        "stdout_tail": _tail(stdout_lines),
+        "stderr_tail": _tail(stderr_lines),
         "dist_folder": str(dist_folder),
         "executable_path": str(executable_path),
     }
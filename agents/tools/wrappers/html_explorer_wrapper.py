@@ -7,59 +7,144 @@ from __future__ import annotations
 
 from collections import Counter
 from html.parser import HTMLParser
+from itertools import islice
 from typing import Any
 
+try:
+    from lxml import etree as lxml_etree  # type: ignore
+    from lxml import html as lxml_html  # type: ignore
+except ImportError:
+    lxml_etree = None  # type: ignore
+    lxml_html = None  # type: ignore
+
 try:
     from agents.tools.wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
 except ImportError:
     from wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".html", ".htm"})
+
+
 class _HTMLSummaryParser(HTMLParser):
-    def __init__(self) -> None:
+    def __init__(self, text_limit: int | None = None) -> None:
         super().__init__()
         self.title: str | None = None
         self._in_title = False
-        self._in_script = False
-        self._in_style = False
+        # Open script/style elements; their data is dropped before any strip() work.
+        self._skip_depth = 0
         self.tag_counts: Counter[str] = Counter()
         self.table_count = 0
-        self.links: list[str] = []
+        self.links: dict[str, None] = {}
         self.text_chunks: list[str] = []
+        # Text is only kept until its joined length passes text_limit; the rest is just tag counting.
+        self.text_limit = text_limit
+        self.text_truncated = False
+        self._text_len = -1
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         self.tag_counts[tag] += 1
         if tag == "title":
             self._in_title = True
-        elif tag == "script":
-            self._in_script = True
-        elif tag == "style":
-            self._in_style = True
+        elif tag == "script" or tag == "style":
+            self._skip_depth += 1
         elif tag == "table":
             self.table_count += 1
 
-        attrs_map = dict(attrs)
-        href = attrs_map.get("href")
+        # Scan in place rather than building a dict per tag; the last href wins, as dict(attrs) did.
+        href = None
+        for name, value in attrs:
+            if name == "href":
+                href = value
         if href:
-            self.links.append(href)
+            self.links[href] = None
 
     def handle_endtag(self, tag: str) -> None:
         if tag == "title":
             self._in_title = False
-        elif tag == "script":
-            self._in_script = False
-        elif tag == "style":
-            self._in_style = False
+        elif (tag == "script" or tag == "style") and self._skip_depth:
+            self._skip_depth -= 1
 
     def handle_data(self, data: str) -> None:
+        if self._skip_depth and not self._in_title:
+            return
         text = data.strip()
         if not text:
             return
         if self._in_title and self.title is None:
             self.title = text
             return
-        if not self._in_script and not self._in_style:
+        if not self._skip_depth and not self.text_truncated:
             self.text_chunks.append(text)
+            self._text_len += len(text) + 1
+            if self.text_limit is not None and self._text_len > self.text_limit:
+                self.text_truncated = True
+
+
+def _bounded_chunks(parts: Any, limit: int) -> tuple[list[str], bool]:
+    """Stripped non-empty chunks until their space-joined length exceeds `limit`."""
+    chunks: list[str] = []
+    joined_len = -1
+    for part in parts:
+        text = part.strip()
+        if not text:
+            continue
+        chunks.append(text)
+        joined_len += len(text) + 1
+        if joined_len > limit:
+            return chunks, True
+    return chunks, False
+
+
+def _summarize_with_parser(raw: str, text_limit: int) -> dict[str, Any]:
+    parser = _HTMLSummaryParser(text_limit=text_limit)
+    parser.feed(raw)
+    parser.close()
+    return {
+        "title": parser.title,
+        "tag_counts": parser.tag_counts,
+        "table_count": parser.table_count,
+        "links": parser.links,
+        "text_chunks": parser.text_chunks,
+        "text_truncated": parser.text_truncated,
+    }
+
+
+def _summarize_with_lxml(raw: str, text_limit: int) -> dict[str, Any] | None:
+    """Same summary as `_HTMLSummaryParser`, tokenized by libxml2; None if lxml is missing or gives up."""
+    if lxml_html is None or not raw.strip():
+        return None
+    try:
+        tree = lxml_html.document_fromstring(raw)
+    except (ValueError, lxml_etree.ParserError):
+        return None
+
+    tag_counts: Counter[str] = Counter()
+    links: dict[str, None] = {}
+    for elem in tree.iter():
+        if not isinstance(elem.tag, str):  # comments and processing instructions
+            continue
+        tag_counts[elem.tag] += 1
+        href = elem.get("href")
+        if href:
+            links[href] = None
+
+    title = None
+    title_node = tree.find(".//title")
+    if title_node is not None and title_node.text and title_node.text.strip():
+        title = title_node.text.strip()
+        title_node.text = None
+    lxml_etree.strip_elements(tree, "script", "style", with_tail=False)
+    text_chunks, text_truncated = _bounded_chunks(tree.itertext(), text_limit)
+
+    return {
+        "title": title,
+        "tag_counts": tag_counts,
+        "table_count": tag_counts["table"],
+        "links": links,
+        "text_chunks": text_chunks,
+        "text_truncated": text_truncated,
+    }
 
 
 def run(args: dict[str, Any]) -> dict[str, Any]:
@@ -69,18 +154,20 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".html", ".htm"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     encoding = parse_encoding(args.get("encoding"), default="utf-8-sig")
     preview_chars = parse_int(args.get("preview_chars"), field="preview_chars", default=400, minimum=0, maximum=8000)
 
     raw = resolved.read_text(encoding=encoding)
-    parser = _HTMLSummaryParser()
-    parser.feed(raw)
-    parser.close()
+    summary = _summarize_with_lxml(raw, preview_chars)
+    if summary is None:
+        summary = _summarize_with_parser(raw, preview_chars)
+    tag_counts = summary["tag_counts"]
 
-    text_content = " ".join(parser.text_chunks)
-    unique_links = list(dict.fromkeys(parser.links))
+    # Only enough text to fill the preview is collected; links are deduplicated as they are seen.
+    text_content = " ".join(summary["text_chunks"])
+    unique_links = summary["links"]
 
     return {
         "status": "ok",
@@ -88,14 +175,14 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         "path": args.get("path"),
         "resolved_path": resolved_str,
         "encoding": encoding,
-        "title": parser.title,
-        "tag_count": sum(parser.tag_counts.values()),
-        "top_tags": parser.tag_counts.most_common(20),
-        "table_count": parser.table_count,
+        "title": summary["title"],
+        "tag_count": sum(tag_counts.values()),
+        "top_tags": tag_counts.most_common(20),
+        "table_count": summary["table_count"],
         "link_count": len(unique_links),
-        "links_preview": unique_links[:50],
+        "links_preview": list(islice(unique_links, 50)),
         "text_preview": text_content[:preview_chars],
-        "truncated": len(text_content) > preview_chars,
+        "truncated": summary["text_truncated"],
         **file_stats(resolved),
     }
 
@@ -6,10 +6,12 @@ Canonical execution wrapper for the `load_json_files` skill.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
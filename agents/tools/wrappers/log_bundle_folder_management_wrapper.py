@@ -7,15 +7,17 @@ from __future__ import annotations
 
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 try:
-    from agents.tools.wrappers._explorer_common import parse_bool
+    from agents.tools.wrappers._explorer_common import parse_bool, stat_once
 except ImportError:
-    from wrappers._explorer_common import parse_bool
+    from wrappers._explorer_common import parse_bool, stat_once
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -56,9 +58,13 @@ def _ensure_not_inside_bundle(path: Path, bundle_root: Path | None) -> None:
 
 
 def _validate_writable(folder: Path) -> None:
+    # access() is a permission check only; the probe file is kept for filesystems where it is unreliable.
+    if os.access(folder, os.W_OK | os.X_OK):
+        return
     probe = folder / ".write_test"
-    probe.write_text("ok", encoding="utf-8")
-    probe.unlink()
+    fd = os.open(probe, os.O_WRONLY | os.O_CREAT, 0o600)
+    os.close(fd)
+    os.unlink(probe)
 
 
 def run(args: dict[str, Any]) -> dict[str, Any]:
@@ -124,11 +130,13 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     fallback_used = False
     selected = target
 
+    # A successful mkdir (or stat) already proves the folder exists; no re-check at the end.
     try:
         if create_if_missing:
             selected.mkdir(parents=True, exist_ok=True)
-        elif not selected.exists():
+        elif stat_once(selected) is None:
             raise FileNotFoundError(f"log folder does not exist: {selected}")
+        folder_exists = True
 
         if validate_writable:
             _validate_writable(selected)
@@ -139,6 +147,9 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         selected = (Path(tempfile.gettempdir()) / f"{app_name}_logs").resolve()
         if create_if_missing:
             selected.mkdir(parents=True, exist_ok=True)
+            folder_exists = True
+        else:
+            folder_exists = stat_once(selected) is not None
         if validate_writable:
             _validate_writable(selected)
 
@@ -151,7 +162,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         "bundle_root": str(bundle_root) if bundle_root is not None else None,
         "requested_log_folder_path": custom,
         "resolved_log_folder": str(selected),
-        "created": bool(selected.exists()) if not dry_run else None,
+        "created": folder_exists,
         "validate_writable": validate_writable,
         "fallback_to_temp": fallback_to_temp,
         "fallback_used": fallback_used,
@@ -6,8 +6,10 @@ Canonical execution wrapper for the `log_overwrite_policy` skill.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+import os
 
 try:
     from agents.tools.wrappers._explorer_common import parse_bool, parse_encoding
@@ -15,6 +17,7 @@ except ImportError:
     from wrappers._explorer_common import parse_bool, parse_encoding
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -91,8 +94,19 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
             "bytes_to_write": len(body.encode(encoding=encoding, errors="replace")),
         }
 
-    resolved.write_text(body, encoding=encoding)
-    size = resolved.stat().st_size
+    # Encode exactly as write_text would (newline translation included) and report the byte count
+    # written instead of stat()-ing the file afterwards.
+    encoded = body.replace("\n", os.linesep).encode(encoding)
+    # A raw fd skips the buffered-file layers for what is a single small write; O_BINARY keeps
+    # Windows from translating newlines a second time.
+    fd = os.open(resolved, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(encoded)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    size = len(encoded)
 
     return {
         "status": "ok",
@@ -14,6 +14,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".md", ".markdown"})
+
+
 HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
 LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
 
@@ -36,7 +39,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".md", ".markdown"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     encoding = parse_encoding(args.get("encoding"), default="utf-8-sig")
     preview_chars = parse_int(args.get("preview_chars"), field="preview_chars", default=400, minimum=0, maximum=8000)
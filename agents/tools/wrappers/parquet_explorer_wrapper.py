@@ -13,6 +13,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_int, resolve_repo_path, to_jsonable
 
 
+SUPPORTED_SUFFIXES = frozenset({".parquet"})
+
+
 def _columns(value: Any) -> list[str] | None:
     if value is None:
         return None
@@ -33,7 +36,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".parquet"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     preview_rows = parse_int(args.get("preview_rows"), field="preview_rows", default=5, minimum=0, maximum=200)
     columns = _columns(args.get("columns"))
@@ -6,6 +6,7 @@ Canonical execution wrapper for the `parquet_to_excel_polars_xlsxwriter` skill.
 from __future__ import annotations
 
 from datetime import date, datetime, time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +15,7 @@ EXCEL_MAX_ROWS = 1_048_576
 INVALID_SHEET_CHARS = set("[]:*?/\\")
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -13,6 +13,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".pdf"})
+
+
 def run(args: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(args, dict):
         raise ValueError("Wrapper args must be a JSON object.")
@@ -20,7 +23,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".pdf"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     preview_pages = parse_int(args.get("preview_pages"), field="preview_pages", default=2, minimum=0, maximum=20)
     preview_chars = parse_int(args.get("preview_chars"), field="preview_chars", default=400, minimum=0, maximum=8000)
@@ -215,6 +215,23 @@ POLICY_SKILL_PROFILES: dict[str, dict[str, Any]] = {
 }
 
 
+# Checks are fixed at import; tuples make that explicit and let slices skip a list copy.
+for _profile in POLICY_SKILL_PROFILES.values():
+    _profile["checks"] = tuple(_profile["checks"])
+del _profile
+
+# Rendered once per profile and output mode; run() only slices to max_items.
+_PRIMARY_OUTPUTS: dict[str, dict[str, tuple[str, ...]]] = {
+    name: {
+        "checklist": profile["checks"],
+        "plan": tuple(f"Step {i + 1}: {item}" for i, item in enumerate(profile["checks"])),
+        "actions": tuple(f"Action {i + 1}: {item}" for i, item in enumerate(profile["checks"])),
+    }
+    for name, profile in POLICY_SKILL_PROFILES.items()
+}
+_KNOWN_SKILLS_STR = ", ".join(sorted(POLICY_SKILL_PROFILES))
+
+
 def _parse_strings(value: Any, *, field: str) -> list[str]:
     if value is None:
         return []
@@ -242,8 +259,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
 
     profile = POLICY_SKILL_PROFILES.get(skill_name)
     if profile is None:
-        known = ", ".join(sorted(POLICY_SKILL_PROFILES.keys()))
-        raise ValueError(f"Unknown policy skill '{skill_name}'. Known: {known}")
+        raise ValueError(f"Unknown policy skill '{skill_name}'. Known: {_KNOWN_SKILLS_STR}")
 
     objective = args.get("objective")
     if objective is not None and (not isinstance(objective, str) or not objective.strip()):
@@ -261,13 +277,8 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     constraints = _parse_strings(args.get("constraints"), field="constraints")
     max_items = parse_int(args.get("max_items"), field="max_items", default=6, minimum=1, maximum=20)
 
-    checks = profile["checks"][:max_items]
-    if output_mode == "actions":
-        primary = [f"Action {i + 1}: {item}" for i, item in enumerate(checks)]
-    elif output_mode == "plan":
-        primary = [f"Step {i + 1}: {item}" for i, item in enumerate(checks)]
-    else:
-        primary = checks
+    # A tuple slice; json serializes it as an array like the list it replaces.
+    primary = _PRIMARY_OUTPUTS[skill_name][output_mode][:max_items]
 
     return {
         "status": "ok",
@@ -15,6 +15,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".pbix", ".pbit"})
+
+
 def _safe_json_preview(raw: bytes, max_chars: int) -> dict[str, Any]:
     try:
         text = raw.decode("utf-8", errors="replace")
@@ -45,7 +48,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".pbix", ".pbit"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     preview_chars = parse_int(args.get("preview_chars"), field="preview_chars", default=500, minimum=0, maximum=10000)
 
@@ -5,7 +5,6 @@ Canonical execution wrapper for the `pptx_explorer` skill.
 
 from __future__ import annotations
 
-from pathlib import PurePosixPath
 from typing import Any
 from xml.etree import ElementTree as ET
 import zipfile
@@ -16,6 +15,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".pptx"})
+
+
 A_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
 CP_NS = {
     "dc": "http://purl.org/dc/elements/1.1/",
@@ -46,7 +48,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".pptx"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     preview_slides = parse_int(args.get("preview_slides"), field="preview_slides", default=5, minimum=0, maximum=50)
 
@@ -7,14 +7,27 @@ from __future__ import annotations
 
 from datetime import date, datetime, time
 import math
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=1)
+def _pandas() -> Any:
+    try:
+        import pandas
+    except ImportError as exc:
+        raise RuntimeError(
+            "pandas is required for read_excel_pandas wrapper. Install with: pip install pandas openpyxl xlrd"
+        ) from exc
+    return pandas
+
+
 def _resolve_excel_path(raw_path: Any) -> tuple[str, Path]:
     if not isinstance(raw_path, str) or not raw_path.strip():
         raise ValueError("path is required and must be a non-empty string.")
@@ -132,14 +145,49 @@ def _to_jsonable(value: Any) -> Any:
     return str(value)
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _finite_or_none(value: Any) -> Any:
+    return value if math.isfinite(value) else None
+
+
+def _isoformat(value: Any) -> Any:
+    # NaT.isoformat() is "NaT", which is what _to_jsonable produced for it.
+    return value.isoformat()
+
+
+def _column_converter(dtype: Any) -> Callable[[Any], Any]:
+    import numpy as np
+
+    # Only plain numpy dtypes have a fixed cell type; nullable/extension dtypes can hold pd.NA.
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return _identity
+        if dtype.kind == "f":
+            return _finite_or_none
+        if dtype.kind == "M":
+            return _isoformat
+    return _to_jsonable
+
+
 def _safe_records(dataframe: Any, preview_rows: int) -> list[dict[str, Any]]:
     if preview_rows == 0:
         return []
-    records: list[dict[str, Any]] = []
     preview = dataframe.head(preview_rows)
-    for _, row in preview.iterrows():
-        records.append({str(column): _to_jsonable(row[column]) for column in dataframe.columns})
-    return records
+    # Picking a converter per column up front keeps the per-cell work to one call; to_dict boxes
+    # cells as native Python scalars, so no per-row Series is built either.
+    converters = {column: (str(column), _column_converter(dtype)) for column, dtype in preview.dtypes.items()}
+    records = preview.to_dict(orient="records")
+    rows: list[dict[str, Any]] = []
+    for record in records:
+        row: dict[str, Any] = {}
+        for column, value in record.items():
+            key, convert = converters[column]
+            row[key] = convert(value)
+        rows.append(row)
+    return rows
 
 
 def run(args: dict[str, Any]) -> dict[str, Any]:
@@ -153,12 +201,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     preview_rows = _preview_rows(args.get("preview_rows"), default=5)
     usecols = _usecols(args.get("usecols"))
 
-    try:
-        import pandas as pd
-    except ImportError as exc:
-        raise RuntimeError(
-            "pandas is required for read_excel_pandas wrapper. Install with: pip install pandas openpyxl xlrd"
-        ) from exc
+    pd = _pandas()
 
     df = pd.read_excel(
         resolved,
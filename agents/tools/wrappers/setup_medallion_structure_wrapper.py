@@ -5,6 +5,7 @@ Canonical execution wrapper for the `setup_medallion_structure` skill.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,7 @@ DEFAULT_LAYERS = ["bronze", "silver", "gold"]
 VALID_LAYERS = set(DEFAULT_LAYERS)
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
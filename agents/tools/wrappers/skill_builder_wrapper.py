@@ -1,6 +1,10 @@
 
+import contextlib
+import importlib
+import io
 import os
 import sys
+import traceback
 import yaml
 import subprocess
 from pathlib import Path
@@ -10,12 +14,44 @@ REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 SKILLS_DIR = REPO_ROOT / "agents/logic/skills"
 WRAPPERS_DIR = REPO_ROOT / "agents/tools/wrappers"
 COMPILER_SCRIPT = REPO_ROOT / "agents/tools/compile_registry.py"
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 def save_file(path: Path, content: str):
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, 'w', encoding='utf-8') as f:
         f.write(content)
 
+def list_names(directory: Path) -> set[str]:
+    """Case-normalized entry names of a directory; empty if it does not exist yet."""
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def run_compiler() -> tuple[int, str, str]:
+    """
+    Runs compile_registry.main() in this interpreter, capturing its output.
+    Falls back to a child process only if the module cannot be imported.
+    """
+    try:
+        compiler = importlib.import_module("agents.tools.compile_registry")
+    except ImportError:
+        try:
+            compiler = importlib.import_module("compile_registry")
+        except ImportError:
+            result = subprocess.run([sys.executable, str(COMPILER_SCRIPT)], capture_output=True, text=True)
+            return result.returncode, result.stdout, result.stderr
+
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            returncode = compiler.main() or 0
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    return returncode, out.getvalue(), err.getvalue()
+
 def run(args: dict) -> dict:
     """
     Executes the skill creation process.
@@ -40,7 +76,13 @@ def run(args: dict) -> dict:
     meta_path = target_skill_dir / f"{skill_name}.meta.yaml"
     wrapper_path = WRAPPERS_DIR / f"{skill_name}_wrapper.py"
     
-    if md_path.exists() or meta_path.exists() or wrapper_path.exists():
+    # One listing covers both cluster files (a new cluster dir costs nothing), plus one stat.
+    cluster_names = list_names(target_skill_dir)
+    if (
+        os.path.normcase(md_path.name) in cluster_names
+        or os.path.normcase(meta_path.name) in cluster_names
+        or wrapper_path.exists()
+    ):
          return {"status": "error", "message": f"Skill '{skill_name}' already exists."}
 
     # 2. Prepare Metadata Content
@@ -63,7 +105,7 @@ def run(args: dict) -> dict:
         
         # Write .meta.yaml
         with open(meta_path, 'w', encoding='utf-8') as f:
-            yaml.dump(meta_content, f, sort_keys=False)
+            yaml.dump(meta_content, f, Dumper=_YAML_DUMPER, sort_keys=False)
         print(f"  - Written: {meta_path}")
         
         # Write Wrapper
@@ -76,15 +118,13 @@ def run(args: dict) -> dict:
     # 4. Run Compiler
     try:
         print("Running registry compiler...")
-        env = dict(os.environ)
-        cmd = [sys.executable, str(COMPILER_SCRIPT)]
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        returncode, compiler_output, compiler_stderr = run_compiler()
         
-        if result.returncode != 0:
+        if returncode != 0:
              return {
                  "status": "warning", 
                  "message": "Skill created but compiler failed.", 
-                 "compiler_stderr": result.stderr
+                 "compiler_stderr": compiler_stderr
              }
              
     except Exception as e:
@@ -94,6 +134,6 @@ def run(args: dict) -> dict:
         "status": "success",
         "skill_name": skill_name,
         "files_created": [str(md_path), str(meta_path), str(wrapper_path)],
-        "compiler_output": result.stdout
+        "compiler_output": compiler_output
     }
 
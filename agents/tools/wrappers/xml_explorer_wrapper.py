@@ -5,22 +5,70 @@ Canonical execution wrapper for the `xml_explorer` skill.
 
 from __future__ import annotations
 
+import codecs
+import io
+import re
 from collections import Counter
 from typing import Any
 from xml.etree import ElementTree as ET
 
+try:
+    from lxml import etree as lxml_etree  # type: ignore
+except ImportError:
+    lxml_etree = None  # type: ignore
+
 try:
     from agents.tools.wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
 except ImportError:
     from wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path
 
 
+SUPPORTED_SUFFIXES = frozenset({".xml"})
+# Encodings expat decodes natively (BOM included), so the file can be fed as raw bytes.
+_EXPAT_BYTE_ENCODINGS = frozenset({"utf-8", "utf-8-sig"})
+_SNIFF_BYTES = 1024
+_XML_DECL_ENCODING_RE = re.compile(rb"^<\?xml[^>]*?\sencoding\s*=\s*[\"']([^\"']*)[\"']")
+
+
 def _local_name(tag: str) -> str:
     if "}" in tag:
         return tag.split("}", 1)[1]
     return tag
 
 
+def _expat_decodes_as_utf8(head: bytes) -> bool:
+    """True if expat, given these raw bytes, would decode them as UTF-8 just as the text path does.
+
+    Expat follows a BOM or the XML declaration, so anything hinting at another encoding
+    (UTF-16/32 byte patterns, or a declaration naming a non-UTF-8 codec) must stay in text mode.
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8):]
+    if not head or head[:1] not in b"< \t\r\n" or b"\x00" in head[:4]:
+        return False
+    match = _XML_DECL_ENCODING_RE.match(head)
+    if match is None:
+        return True
+    try:
+        return codecs.lookup(match.group(1).decode("ascii")).name == "utf-8"
+    except (LookupError, UnicodeDecodeError):
+        return False
+
+
+def _iterparse(handle: Any, raw_bytes: bool) -> Any:
+    # libxml2 is only given raw bytes. Comments and PIs are dropped at parse time as ElementTree
+    # does, and only internal DTD entities are expanded (lxml 5+), matching expat.
+    if raw_bytes and lxml_etree is not None and lxml_etree.LXML_VERSION >= (5,):
+        return lxml_etree.iterparse(
+            handle,
+            events=("start", "end"),
+            remove_comments=True,
+            remove_pis=True,
+            resolve_entities="internal",
+        )
+    return ET.iterparse(handle, events=("start", "end"))
+
+
 def run(args: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(args, dict):
         raise ValueError("Wrapper args must be a JSON object.")
@@ -28,27 +76,76 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".xml"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     encoding = parse_encoding(args.get("encoding"), default="utf-8-sig")
     preview_chars = parse_int(args.get("preview_chars"), field="preview_chars", default=400, minimum=0, maximum=8000)
 
-    raw = resolved.read_text(encoding=encoding)
-    root = ET.fromstring(raw)
-
     element_count = 0
     attribute_count = 0
-    namespaces: set[str] = set()
-    child_tag_counter: Counter[str] = Counter()
-    for idx, elem in enumerate(root.iter()):
-        element_count += 1
-        attribute_count += len(elem.attrib)
-        if "}" in elem.tag:
-            namespaces.add(elem.tag.split("}")[0].lstrip("{"))
-        if idx > 0:
-            child_tag_counter[_local_name(elem.tag)] += 1
+    # Children are tallied by raw (Clark) tag; local names and namespaces are derived once
+    # per distinct tag after the scan instead of once per element.
+    raw_child_tags: Counter[str] = Counter()
+    root_raw_tag = ""
+    text_parts: list[str] = []
+    text_len = -1
+    truncated = False
+
+    def take(part: str | None) -> None:
+        nonlocal text_len, truncated
+        if truncated or not part:
+            return
+        part = part.strip()
+        if part:
+            text_parts.append(part)
+            text_len += len(part) + 1
+            truncated = text_len > preview_chars
 
-    text_content = " ".join(part.strip() for part in root.itertext() if part and part.strip())
+    # Each open element carries whether a child has been seen; text segments are taken in
+    # document order once the parser has moved past them, and finished children are dropped.
+    stack: list[list[Any]] = []
+    utf8_requested = codecs.lookup(encoding).name in _EXPAT_BYTE_ENCODINGS
+    source = resolved.open("rb")
+    raw_bytes = utf8_requested and _expat_decodes_as_utf8(source.read(_SNIFF_BYTES))
+    source.seek(0)
+    handle = source if raw_bytes else io.TextIOWrapper(source, encoding=encoding)
+    with handle:
+        for event, elem in _iterparse(handle, raw_bytes):
+            if event == "start":
+                element_count += 1
+                attribute_count += len(elem.attrib)
+                if stack:
+                    raw_child_tags[elem.tag] += 1
+                    parent = stack[-1]
+                    if parent[1]:
+                        take(parent[0][0].tail)
+                        del parent[0][0]
+                    else:
+                        take(parent[0].text)
+                        parent[1] = True
+                else:
+                    root_raw_tag = elem.tag
+                stack.append([elem, False])
+            else:
+                if stack[-1][1]:
+                    take(elem[0].tail)
+                    del elem[0]
+                else:
+                    take(elem.text)
+                elem.text = None
+                stack.pop()
+
+    text_content = " ".join(text_parts)
+
+    # Merging in first-seen order of raw tags keeps local names in first-seen order too, so
+    # most_common() breaks ties exactly as a per-element count would.
+    child_tag_counter: Counter[str] = Counter()
+    namespaces: set[str] = set()
+    for tag, count in raw_child_tags.items():
+        child_tag_counter[_local_name(tag)] += count
+    for tag in (root_raw_tag, *raw_child_tags):
+        if "}" in tag:
+            namespaces.add(tag.split("}")[0].lstrip("{"))
 
     return {
         "status": "ok",
@@ -56,14 +153,14 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
         "path": args.get("path"),
         "resolved_path": resolved_str,
         "encoding": encoding,
-        "root_tag": _local_name(root.tag),
+        "root_tag": _local_name(root_raw_tag),
         "namespace_count": len(namespaces),
         "namespaces": sorted(namespaces),
         "element_count": element_count,
         "attribute_count": attribute_count,
         "top_child_tags": child_tag_counter.most_common(20),
         "text_preview": text_content[:preview_chars],
-        "truncated": len(text_content) > preview_chars,
+        "truncated": truncated,
         **file_stats(resolved),
     }
 
@@ -21,6 +21,9 @@ except ImportError:
     from wrappers._explorer_common import file_stats, parse_encoding, parse_int, resolve_repo_path, to_jsonable
 
 
+SUPPORTED_SUFFIXES = frozenset({".yaml", ".yml"})
+
+
 def _type_name(value: Any) -> str:
     if isinstance(value, dict):
         return "object"
@@ -64,7 +67,7 @@ def run(args: dict[str, Any]) -> dict[str, Any]:
     resolved_str, resolved = resolve_repo_path(
         args.get("path"),
         field_name="path",
-        allowed_suffixes={".yaml", ".yml"},
+        allowed_suffixes=SUPPORTED_SUFFIXES,
     )
     encoding = parse_encoding(args.get("encoding"), default="utf-8-sig")
     schema_depth = parse_int(args.get("schema_depth"), field="schema_depth", default=2, minimum=1, maximum=6)
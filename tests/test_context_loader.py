@@ -0,0 +1,22 @@
+from agents.tools import context_loader
+
+
+def test_cached_artifacts_are_not_shared_with_callers(tmp_path, monkeypatch):
+    (tmp_path / "metrics.yaml").write_text(
+        "summary:\n  modules: 3\ncycles:\n  sccs:\n    - [a, b]\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(context_loader, "get_project_root", lambda: str(tmp_path))
+    monkeypatch.setattr(
+        context_loader,
+        "_get_registry",
+        lambda: {"metrics": {"path": "metrics.yaml", "format": "yaml", "description": ""}},
+    )
+    monkeypatch.setattr(context_loader, "_parsed_cache", {})
+
+    first = context_loader.load_on_demand("metrics", section="cycles", check_staleness=False)
+    first["data"]["sccs"][0].append("mutated")
+    first["data"]["extra"] = True
+
+    second = context_loader.load_on_demand("metrics", section="cycles", check_staleness=False)
+    assert second["data"] == {"sccs": [["a", "b"]]}
+    assert len(context_loader._parsed_cache) == 1
@@ -0,0 +1,46 @@
+import zipfile
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from agents.tools.wrappers import _explorer_common
+from agents.tools.wrappers import docx_explorer_wrapper as docx_explorer
+
+W_NS = docx_explorer.W_NS["w"]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(_explorer_common, "project_root", lambda: tmp_path)
+    return tmp_path
+
+
+def _write_docx(path, document_xml, core_xml=None):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("word/document.xml", document_xml)
+        if core_xml is not None:
+            zf.writestr("docProps/core.xml", core_xml)
+
+
+def test_external_entities_are_not_expanded(project):
+    secret = project / "secret.txt"
+    secret.write_text("TOP-SECRET", encoding="utf-8")
+    doctype = f'<!DOCTYPE d [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>'
+    document = (
+        f'<?xml version="1.0"?>{doctype}'
+        f'<w:document xmlns:w="{W_NS}"><w:body><w:p><w:r><w:t>a&xxe;b</w:t></w:r></w:p></w:body></w:document>'
+    )
+    core = (
+        f'<?xml version="1.0"?>{doctype}'
+        '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"'
+        ' xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>&xxe;</dc:title></cp:coreProperties>'
+    )
+    _write_docx(project / "evil.docx", document, core)
+
+    if docx_explorer._LXML_HARDENING is None:
+        # expat refuses to expand the external entity at all, which is equally safe.
+        with pytest.raises(ParseError):
+            docx_explorer.run({"path": "evil.docx"})
+        return
+    result = docx_explorer.run({"path": "evil.docx"})
+    assert "TOP-SECRET" not in repr(result)
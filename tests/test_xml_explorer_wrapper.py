@@ -0,0 +1,62 @@
+import pytest
+
+from agents.tools.wrappers import _explorer_common
+from agents.tools.wrappers import xml_explorer_wrapper as xml_explorer
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(_explorer_common, "project_root", lambda: tmp_path)
+    return tmp_path
+
+
+def _run(project, name, payload, **args):
+    (project / name).write_bytes(payload)
+    return xml_explorer.run({"path": name, **args})
+
+
+def test_declared_encoding_does_not_override_requested_encoding(project):
+    # UTF-8 bytes that claim ISO-8859-1: the caller's utf-8-sig decoding wins, as it always has.
+    payload = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<r>café</r>'.encode("utf-8")
+    result = _run(project, "mismatch.xml", payload)
+    assert result["text_preview"] == "café"
+    assert result["encoding"] == "utf-8-sig"
+
+
+def test_latin1_bytes_are_still_rejected_under_default_encoding(project):
+    payload = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<r>café</r>'.encode("latin-1")
+    with pytest.raises(UnicodeDecodeError):
+        _run(project, "latin1.xml", payload)
+
+
+def test_explicit_encoding_decodes_latin1(project):
+    payload = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<r>café</r>'.encode("latin-1")
+    result = _run(project, "latin1.xml", payload, encoding="latin-1")
+    assert result["text_preview"] == "café"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'<?xml version="1.0" encoding="UTF-8"?>\n<r>caf\xc3\xa9</r>',
+        b"\xef\xbb\xbf<r>caf\xc3\xa9</r>",
+        b"<r>caf\xc3\xa9</r>",
+    ],
+)
+def test_utf8_documents_parse_from_bytes(project, payload):
+    assert xml_explorer._expat_decodes_as_utf8(payload)
+    result = _run(project, "utf8.xml", payload)
+    assert result["text_preview"] == "café"
+    assert result["root_tag"] == "r"
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b'<?xml version="1.0" encoding="ISO-8859-1"?><r/>',
+        b"\xff\xfe<\x00r\x00/\x00>\x00",
+        b"<\x00r\x00/\x00>\x00",
+    ],
+)
+def test_non_utf8_heads_stay_in_text_mode(head):
+    assert not xml_explorer._expat_decodes_as_utf8(head)